@@ -35,28 +35,13 @@ class CalendarService:
         
         normalized_token = token.strip()
         
-        watchlist_query = """
+        # Fetch the watchlist metadata and its stock events in one round-trip.
+        # The watchlist row is kept via LEFT JOINs even when it has no matching events,
+        # in which case the event columns come back as NULL.
+        calendar_query = """
         SELECT
-            w.id,
-            w.name,
-            ws.reminder_before
-        FROM watchlists w
-        LEFT JOIN watchlist_settings ws ON w.id = ws.watchlist_id
-        WHERE w.calendar_token = :token
-        """
-        
-        watchlist_rows = list(self.db.execute_query(query=watchlist_query, params={'token': normalized_token}))
-        if not watchlist_rows:
-            raise LookupError('Watchlist not found for the provided calendar token.')
-        
-        watchlist = dict(watchlist_rows[0])
-        watchlist_id = watchlist['id']
-        watchlist_name = watchlist.get('name') or 'Stock Events'
-        reminder_before: Optional[timedelta] = watchlist.get('reminder_before')
-        
-        # Query to fetch stock events for the watchlist, filtered by watchlist settings
-        stock_event_query = """
-        SELECT 
+            w.name AS watchlist_name,
+            ws.reminder_before,
             s.ticker,
             s.name,
             s.last_updated as stock_last_updated,
@@ -64,12 +49,11 @@ class CalendarService:
             se.event_date,
             se.last_updated as event_last_updated,
             se.source
-        FROM stock_events se
-        INNER JOIN stocks s ON se.stock_ticker = s.ticker
-        INNER JOIN follows f ON s.ticker = f.stock_ticker
-        INNER JOIN watchlists w ON f.watchlist_id = w.id
-        INNER JOIN watchlist_settings ws ON w.id = ws.watchlist_id
-        WHERE w.id = :watchlist_id
+        FROM watchlists w
+        LEFT JOIN watchlist_settings ws ON w.id = ws.watchlist_id
+        LEFT JOIN follows f ON f.watchlist_id = w.id
+        LEFT JOIN stocks s ON s.ticker = f.stock_ticker
+        LEFT JOIN stock_events se ON se.stock_ticker = s.ticker
         AND (
             (se.type = 'EARNINGS_ANNOUNCEMENT' AND ws.include_earnings_announcement = TRUE) OR
             (se.type = 'DIVIDEND_EX' AND ws.include_dividend_ex = TRUE) OR
@@ -78,15 +62,26 @@ class CalendarService:
             (se.type = 'DIVIDEND_PAYMENT' AND ws.include_dividend_payment = TRUE) OR
             (se.type = 'STOCK_SPLIT' AND ws.include_stock_split = TRUE)
         )
+        WHERE w.calendar_token = :token
         ORDER BY se.event_date ASC
         """
         
-        results = self.db.execute_query(query=stock_event_query, params={"watchlist_id": watchlist_id})
+        results = list(self.db.execute_query(query=calendar_query, params={'token': normalized_token}))
+        if not results:
+            raise LookupError('Watchlist not found for the provided calendar token.')
+        
+        watchlist = results[0]
+        watchlist_name = watchlist.get('watchlist_name') or 'Stock Events'
+        reminder_before: Optional[timedelta] = watchlist.get('reminder_before')
         
         # Convert database results to StockEvent objects
         stock_events: List[StockEvent] = []
         
         for row in results:
+            # Skip the placeholder row of a watchlist without (matching) events
+            if row['type'] is None:
+                continue
+            
             # Create Stock object
             stock = Stock(
                 name=row['name'],
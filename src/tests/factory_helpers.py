@@ -0,0 +1,22 @@
+# Disclaimer: Created by GitHub Copilot
+'''
+Shared helpers for the DatabaseAdapterFactory test modules.
+'''
+
+from src.database.adapter_factory import DatabaseAdapterFactory
+
+
+def reset_factory_if_dirty():
+    """Reset the factory only if a test left an instance or environment behind."""
+    if (DatabaseAdapterFactory._instance is not None
+            or DatabaseAdapterFactory._environment is not None):
+        DatabaseAdapterFactory.reset()
+
+
+class FactoryResetMixin:
+    """Register a factory reset as cleanup for every test."""
+    
+    def setUp(self):
+        """Reset the factory after the test, even if it fails."""
+        super().setUp()
+        self.addCleanup(reset_factory_if_dirty)
@@ -12,12 +12,16 @@ import sys
 import os
 import argparse
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv(Path('.env'))
 
+# Recorded Alpha Vantage responses, replayed by the integration tests without an API key
+AV_CASSETTE_DIR = Path(__file__).parent / 'fixtures' / 'alphavantage'
+
 
 def check_env_var(var_name):
     '''Check if environment variable is set.'''
@@ -30,6 +34,15 @@ def check_env_var(var_name):
         return False
 
 
+def run_test_module(test, verbose=True):
+    '''Run a single test module in its own unittest process.'''
+    cmd = ['python', '-m', 'unittest', test]
+    if verbose:
+        cmd.append('-v')
+    
+    return subprocess.run(cmd, capture_output=True, text=True)
+
+
 def run_unit_tests(verbose=True):
     '''Run unit tests (no API calls).'''
     print("\n" + "="*70)
@@ -59,18 +72,17 @@ def run_unit_tests(verbose=True):
     os.environ['SKIP_INTEGRATION_TESTS'] = '1'
     os.environ['SKIP_DB_INTEGRATION_TESTS'] = '1'
     
-    for test in tests:
-        print(f"\nRunning {test}...")
-        cmd = ['python', '-m', 'unittest', test]
-        if verbose:
-            cmd.append('-v')
+    # Unit test modules share no state, so run them in parallel processes
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = executor.map(lambda test: run_test_module(test, verbose), tests)
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            print(f"\n✗ {test} failed!")
-            print("stdout:\n", result.stdout)
-            print("stderr:\n", result.stderr)
-            return False
+        for test, result in zip(tests, results):
+            print(f"\nResults for {test}:")
+            if result.returncode != 0:
+                print(f"\n✗ {test} failed!")
+                print("stdout:\n", result.stdout)
+                print("stderr:\n", result.stderr)
+                return False
     
     print("\n" + "="*70)
     print("✓ All unit tests passed!")
@@ -90,8 +102,11 @@ def run_api_integration_tests(verbose=True):
     print("Checking for API keys...")
     has_alpha_vantage = check_env_var('API_KEY_ALPHA_VANTAGE')
     has_finnhub = check_env_var('API_KEY_FINNHUB')
+    has_av_cassettes = any(AV_CASSETTE_DIR.glob('*.yaml'))
+    if has_av_cassettes and not has_alpha_vantage:
+        print(f"  ✓ Alpha Vantage cassettes found in {AV_CASSETTE_DIR} (replayed without a key)")
     
-    if not has_alpha_vantage and not has_finnhub:
+    if not has_alpha_vantage and not has_finnhub and not has_av_cassettes:
         print("\n✗ No API keys found!")
         print("\nPlease set at least one of:")
         print("  export API_KEY_ALPHA_VANTAGE='your_key'")
@@ -116,7 +131,7 @@ def run_api_integration_tests(verbose=True):
     os.environ['SKIP_DB_INTEGRATION_TESTS'] = '1'
     
     tests = []
-    if has_alpha_vantage:
+    if has_alpha_vantage or has_av_cassettes:
         tests.append('src.tests.test_alpha_vantage_integration')
     if has_finnhub:
         tests.append('src.tests.test_finnhub_integration')
@@ -124,11 +139,7 @@ def run_api_integration_tests(verbose=True):
     success = True
     for test in tests:
         print(f"\nRunning {test}...")
-        cmd = ['python', '-m', 'unittest', test]
-        if verbose:
-            cmd.append('-v')
-        
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = run_test_module(test, verbose)
         if result.returncode != 0:
             print(f"\n⚠️  {test} had failures (may be due to rate limits)")
             print("stdout:\n", result.stdout)
@@ -196,11 +207,7 @@ def run_db_integration_tests(verbose=True):
     success = True
     for test in tests:
         print(f"\nRunning {test}...")
-        cmd = ['python', '-m', 'unittest', test]
-        if verbose:
-            cmd.append('-v')
-        
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = run_test_module(test, verbose)
         if result.returncode != 0:
             print(f"\n⚠️  {test} had failures")
             print("stdout:\n", result.stdout)
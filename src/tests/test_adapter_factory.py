@@ -1,15 +1,33 @@
 # Disclaimer: Created by GitHub Copilot
 
+import sys
+import types
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import DEFAULT, Mock, patch, MagicMock
 from src.database.adapter_factory import (
     DatabaseAdapterFactory,
     DatabaseEnvironment,
     parse_environment_from_args
 )
-from src.database.adapter_base import DatabaseAdapterBaseDefinition
 from src.database.local_adapter import LocalDatabaseAdapter
-from src.database.gcp_adapter import GcpDatabaseAdapter
+from src.tests.factory_helpers import FactoryResetMixin
+
+
+# Shared adapter mock for the close() tests, reset between tests
+_LOCAL_ADAPTER_MOCK = MagicMock(spec_set=LocalDatabaseAdapter)
+
+# Placeholder adapter for tests that only need a non-None, closable instance
+_BASE_ADAPTER_STUB = types.SimpleNamespace(close=lambda: None)
+
+
+# (id, argv, expected environment) cases for parse_environment_from_args
+_ARGV_CASES = (
+    ('deployment', ['script.py', '--deployment'], DatabaseEnvironment.DEPLOYMENT),
+    ('development', ['script.py', '--development'], DatabaseEnvironment.DEVELOPMENT),
+    ('no_flags', ['script.py'], DatabaseEnvironment.DEVELOPMENT),
+    ('unknown_flag', ['script.py', '--unknown'], DatabaseEnvironment.DEVELOPMENT),
+    ('deployment_takes_precedence', ['script.py', '--development', '--deployment'], DatabaseEnvironment.DEPLOYMENT),
+)
 
 
 class TestDatabaseEnvironmentEnum(unittest.TestCase):
@@ -29,36 +47,17 @@ class TestDatabaseEnvironmentEnum(unittest.TestCase):
         self.assertIn(DatabaseEnvironment.DEPLOYMENT, DatabaseEnvironment)
 
 
-class TestDatabaseAdapterFactoryInitialization(unittest.TestCase):
+class TestDatabaseAdapterFactoryInitialization(FactoryResetMixin, unittest.TestCase):
     """Test DatabaseAdapterFactory initialization."""
     
-    def setUp(self):
-        """Reset factory before each test."""
-        DatabaseAdapterFactory.reset()
-    
-    def tearDown(self):
-        """Clean up after each test."""
-        DatabaseAdapterFactory.reset()
-    
-    def test_initialize_development_environment(self):
-        """Test initialization with development environment."""
-        DatabaseAdapterFactory.initialize(DatabaseEnvironment.DEVELOPMENT)
-        
-        self.assertEqual(
-            DatabaseAdapterFactory._environment,
-            DatabaseEnvironment.DEVELOPMENT
-        )
-        self.assertIsNone(DatabaseAdapterFactory._instance)
-    
-    def test_initialize_deployment_environment(self):
-        """Test initialization with deployment environment."""
-        DatabaseAdapterFactory.initialize(DatabaseEnvironment.DEPLOYMENT)
-        
-        self.assertEqual(
-            DatabaseAdapterFactory._environment,
-            DatabaseEnvironment.DEPLOYMENT
-        )
-        self.assertIsNone(DatabaseAdapterFactory._instance)
+    def test_initialize_sets_environment(self):
+        """Test initialization with each environment."""
+        for environment in DatabaseEnvironment:
+            with self.subTest(environment=environment):
+                DatabaseAdapterFactory.initialize(environment)
+                
+                self.assertEqual(DatabaseAdapterFactory._environment, environment)
+                self.assertIsNone(DatabaseAdapterFactory._instance)
     
     def test_initialize_resets_existing_instance(self):
         """Test that initialization resets existing instance."""
@@ -67,8 +66,7 @@ class TestDatabaseAdapterFactoryInitialization(unittest.TestCase):
         
         # Get an instance
         with patch.object(DatabaseAdapterFactory, '_create_adapter') as mock_create:
-            mock_adapter = Mock(spec=DatabaseAdapterBaseDefinition)
-            mock_create.return_value = mock_adapter
+            mock_create.return_value = _BASE_ADAPTER_STUB
             instance1 = DatabaseAdapterFactory.get_instance()
         
         self.assertIsNotNone(DatabaseAdapterFactory._instance)
@@ -84,17 +82,9 @@ class TestDatabaseAdapterFactoryInitialization(unittest.TestCase):
         )
 
 
-class TestDatabaseAdapterFactoryGetInstance(unittest.TestCase):
+class TestDatabaseAdapterFactoryGetInstance(FactoryResetMixin, unittest.TestCase):
     """Test DatabaseAdapterFactory.get_instance() method."""
     
-    def setUp(self):
-        """Reset factory before each test."""
-        DatabaseAdapterFactory.reset()
-    
-    def tearDown(self):
-        """Clean up after each test."""
-        DatabaseAdapterFactory.reset()
-    
     def test_get_instance_without_initialization_raises_error(self):
         """Test that get_instance raises RuntimeError if not initialized."""
         with self.assertRaises(RuntimeError) as context:
@@ -106,7 +96,7 @@ class TestDatabaseAdapterFactoryGetInstance(unittest.TestCase):
     @patch('src.database.adapter_factory.LocalDatabaseAdapter')
     def test_get_instance_creates_adapter_first_time(self, mock_local_adapter):
         """Test that get_instance creates adapter on first call."""
-        mock_adapter = Mock(spec=LocalDatabaseAdapter)
+        mock_adapter = _BASE_ADAPTER_STUB
         mock_local_adapter.return_value = mock_adapter
         
         DatabaseAdapterFactory.initialize(DatabaseEnvironment.DEVELOPMENT)
@@ -121,7 +111,7 @@ class TestDatabaseAdapterFactoryGetInstance(unittest.TestCase):
     @patch('src.database.adapter_factory.LocalDatabaseAdapter')
     def test_get_instance_returns_singleton(self, mock_local_adapter):
         """Test that get_instance returns the same instance (singleton pattern)."""
-        mock_adapter = Mock(spec=LocalDatabaseAdapter)
+        mock_adapter = _BASE_ADAPTER_STUB
         mock_local_adapter.return_value = mock_adapter
         
         DatabaseAdapterFactory.initialize(DatabaseEnvironment.DEVELOPMENT)
@@ -139,21 +129,13 @@ class TestDatabaseAdapterFactoryGetInstance(unittest.TestCase):
         mock_local_adapter.assert_called_once()
 
 
-class TestDatabaseAdapterFactoryCreateAdapter(unittest.TestCase):
+class TestDatabaseAdapterFactoryCreateAdapter(FactoryResetMixin, unittest.TestCase):
     """Test DatabaseAdapterFactory._create_adapter() method."""
     
-    def setUp(self):
-        """Reset factory before each test."""
-        DatabaseAdapterFactory.reset()
-    
-    def tearDown(self):
-        """Clean up after each test."""
-        DatabaseAdapterFactory.reset()
-    
     @patch('src.database.adapter_factory.LocalDatabaseAdapter')
     def test_create_adapter_development_environment(self, mock_local_adapter):
         """Test creating adapter for development environment."""
-        mock_adapter = Mock(spec=LocalDatabaseAdapter)
+        mock_adapter = object()
         mock_local_adapter.return_value = mock_adapter
         
         adapter = DatabaseAdapterFactory._create_adapter(
@@ -166,7 +148,7 @@ class TestDatabaseAdapterFactoryCreateAdapter(unittest.TestCase):
     @patch('src.database.adapter_factory.GcpDatabaseAdapter')
     def test_create_adapter_deployment_environment(self, mock_gcp_adapter):
         """Test creating adapter for deployment environment."""
-        mock_adapter = Mock(spec=GcpDatabaseAdapter)
+        mock_adapter = object()
         mock_gcp_adapter.return_value = mock_adapter
         
         adapter = DatabaseAdapterFactory._create_adapter(
@@ -188,17 +170,9 @@ class TestDatabaseAdapterFactoryCreateAdapter(unittest.TestCase):
         self.assertIn("Unknown environment", str(context.exception))
 
 
-class TestDatabaseAdapterFactoryCreateLocalAdapter(unittest.TestCase):
+class TestDatabaseAdapterFactoryCreateLocalAdapter(FactoryResetMixin, unittest.TestCase):
     """Test DatabaseAdapterFactory._create_local_adapter() method."""
     
-    def setUp(self):
-        """Reset factory before each test."""
-        DatabaseAdapterFactory.reset()
-    
-    def tearDown(self):
-        """Clean up after each test."""
-        DatabaseAdapterFactory.reset()
-    
     @patch('src.database.adapter_factory.LocalDatabaseAdapter')
     def test_create_local_adapter_with_correct_parameters(self, mock_local_adapter):
         """Test that local adapter is created with correct parameters."""
@@ -221,21 +195,13 @@ class TestDatabaseAdapterFactoryCreateLocalAdapter(unittest.TestCase):
         self.assertEqual(adapter, mock_adapter)
 
 
-class TestDatabaseAdapterFactoryCreateGcpAdapter(unittest.TestCase):
+class TestDatabaseAdapterFactoryCreateGcpAdapter(FactoryResetMixin, unittest.TestCase):
     """Test DatabaseAdapterFactory._create_gcp_adapter() method."""
     
-    def setUp(self):
-        """Reset factory before each test."""
-        DatabaseAdapterFactory.reset()
-    
-    def tearDown(self):
-        """Clean up after each test."""
-        DatabaseAdapterFactory.reset()
-    
     @patch('src.database.adapter_factory.GcpDatabaseAdapter')
     def test_create_gcp_adapter(self, mock_gcp_adapter):
         """Test that GCP adapter is created."""
-        mock_adapter = Mock(spec=GcpDatabaseAdapter)
+        mock_adapter = object()
         mock_gcp_adapter.return_value = mock_adapter
         
         adapter = DatabaseAdapterFactory._create_gcp_adapter()
@@ -245,22 +211,19 @@ class TestDatabaseAdapterFactoryCreateGcpAdapter(unittest.TestCase):
         self.assertEqual(adapter, mock_adapter)
 
 
-class TestDatabaseAdapterFactoryReset(unittest.TestCase):
+class TestDatabaseAdapterFactoryReset(FactoryResetMixin, unittest.TestCase):
     """Test DatabaseAdapterFactory.reset() method."""
     
     def setUp(self):
-        """Reset factory before each test."""
-        DatabaseAdapterFactory.reset()
-    
-    def tearDown(self):
-        """Clean up after each test."""
-        DatabaseAdapterFactory.reset()
+        """Clear calls and side effects on the shared adapter mock."""
+        super().setUp()
+        _LOCAL_ADAPTER_MOCK.reset_mock(side_effect=True)
     
     def test_reset_clears_instance_and_environment(self):
         """Test that reset clears instance and environment."""
         DatabaseAdapterFactory.initialize(DatabaseEnvironment.DEVELOPMENT)
         DatabaseAdapterFactory._environment = DatabaseEnvironment.DEVELOPMENT
-        DatabaseAdapterFactory._instance = Mock(spec=DatabaseAdapterBaseDefinition)
+        DatabaseAdapterFactory._instance = _BASE_ADAPTER_STUB
         
         DatabaseAdapterFactory.reset()
         
@@ -270,9 +233,7 @@ class TestDatabaseAdapterFactoryReset(unittest.TestCase):
     @patch('src.database.adapter_factory.LocalDatabaseAdapter')
     def test_reset_closes_existing_adapter(self, mock_local_adapter):
         """Test that reset calls close() on existing adapter."""
-        mock_adapter = Mock(spec=LocalDatabaseAdapter)
-        mock_adapter.close = Mock()
-        mock_local_adapter.return_value = mock_adapter
+        mock_local_adapter.return_value = _LOCAL_ADAPTER_MOCK
         
         DatabaseAdapterFactory.initialize(DatabaseEnvironment.DEVELOPMENT)
         DatabaseAdapterFactory.get_instance()
@@ -280,15 +241,14 @@ class TestDatabaseAdapterFactoryReset(unittest.TestCase):
         # Reset should close the adapter
         DatabaseAdapterFactory.reset()
         
-        mock_adapter.close.assert_called_once()
+        _LOCAL_ADAPTER_MOCK.close.assert_called_once()
         self.assertIsNone(DatabaseAdapterFactory._instance)
     
     @patch('src.database.adapter_factory.LocalDatabaseAdapter')
     def test_reset_handles_close_exception_gracefully(self, mock_local_adapter):
         """Test that reset handles exceptions from close() gracefully."""
-        mock_adapter = Mock(spec=LocalDatabaseAdapter)
-        mock_adapter.close = Mock(side_effect=Exception("Close failed"))
-        mock_local_adapter.return_value = mock_adapter
+        _LOCAL_ADAPTER_MOCK.close.side_effect = Exception("Close failed")
+        mock_local_adapter.return_value = _LOCAL_ADAPTER_MOCK
         
         DatabaseAdapterFactory.initialize(DatabaseEnvironment.DEVELOPMENT)
         DatabaseAdapterFactory.get_instance()
@@ -303,112 +263,65 @@ class TestDatabaseAdapterFactoryReset(unittest.TestCase):
 class TestParseEnvironmentFromArgs(unittest.TestCase):
     """Test parse_environment_from_args() function."""
     
-    def test_parse_deployment_flag(self):
-        """Test parsing --deployment flag."""
-        with patch('sys.argv', ['script.py', '--deployment']):
-            env = parse_environment_from_args()
-            self.assertEqual(env, DatabaseEnvironment.DEPLOYMENT)
-    
-    def test_parse_development_flag(self):
-        """Test parsing --development flag."""
-        with patch('sys.argv', ['script.py', '--development']):
-            env = parse_environment_from_args()
-            self.assertEqual(env, DatabaseEnvironment.DEVELOPMENT)
-    
-    def test_parse_no_flags_defaults_to_development(self):
-        """Test that no flags defaults to development."""
-        with patch('sys.argv', ['script.py']):
-            env = parse_environment_from_args()
-            self.assertEqual(env, DatabaseEnvironment.DEVELOPMENT)
-    
-    def test_parse_unknown_flag_defaults_to_development(self):
-        """Test that unknown flags default to development."""
-        with patch('sys.argv', ['script.py', '--unknown']):
-            env = parse_environment_from_args()
-            self.assertEqual(env, DatabaseEnvironment.DEVELOPMENT)
-    
-    def test_parse_multiple_flags_deployment_takes_precedence(self):
-        """Test that --deployment takes precedence over --development."""
-        with patch('sys.argv', ['script.py', '--development', '--deployment']):
-            env = parse_environment_from_args()
-            self.assertEqual(env, DatabaseEnvironment.DEPLOYMENT)
+    def test_parse_environment_from_args(self):
+        """Test parsing command-line flags into an environment."""
+        self.addCleanup(setattr, sys, 'argv', sys.argv)
+        for case_id, argv, expected in _ARGV_CASES:
+            with self.subTest(case_id):
+                sys.argv = argv
+                env = parse_environment_from_args()
+                self.assertEqual(env, expected)
 
 
-class TestDatabaseAdapterFactoryEndToEnd(unittest.TestCase):
+class TestDatabaseAdapterFactoryEndToEnd(FactoryResetMixin, unittest.TestCase):
     """End-to-end integration tests for DatabaseAdapterFactory."""
     
-    def setUp(self):
-        """Reset factory before each test."""
-        DatabaseAdapterFactory.reset()
-    
-    def tearDown(self):
-        """Clean up after each test."""
-        DatabaseAdapterFactory.reset()
-    
-    @patch('src.database.adapter_factory.LocalDatabaseAdapter')
-    def test_full_workflow_development(self, mock_local_adapter):
-        """Test complete workflow for development environment."""
-        mock_adapter = Mock(spec=LocalDatabaseAdapter)
-        mock_local_adapter.return_value = mock_adapter
-        
-        # Initialize factory
+    @patch.multiple(
+        'src.database.adapter_factory',
+        LocalDatabaseAdapter=DEFAULT,
+        GcpDatabaseAdapter=DEFAULT
+    )
+    def test_full_workflow(self, **mock_adapters):
+        """Test the complete workflow for each environment, then switching between them."""
+        cases = [
+            (DatabaseEnvironment.DEVELOPMENT, mock_adapters['LocalDatabaseAdapter']),
+            (DatabaseEnvironment.DEPLOYMENT, mock_adapters['GcpDatabaseAdapter']),
+        ]
+        
+        for environment, adapter_class in cases:
+            with self.subTest(environment=environment):
+                mock_adapter = adapter_class.return_value
+                
+                # Initialize factory
+                DatabaseAdapterFactory.initialize(environment)
+                
+                # Get instance multiple times
+                instance1 = DatabaseAdapterFactory.get_instance()
+                instance2 = DatabaseAdapterFactory.get_instance()
+                
+                # Should be this environment's adapter, created once
+                self.assertIs(instance1, mock_adapter)
+                self.assertIs(instance2, mock_adapter)
+                adapter_class.assert_called_once()
+                
+                # Reset and verify cleanup
+                DatabaseAdapterFactory.reset()
+                mock_adapter.close.assert_called_once()
+                self.assertIsNone(DatabaseAdapterFactory._instance)
+                
+                # Should raise error after reset
+                with self.assertRaises(RuntimeError):
+                    DatabaseAdapterFactory.get_instance()
+        
+        # Switch environments by re-initializing, without a reset in between
         DatabaseAdapterFactory.initialize(DatabaseEnvironment.DEVELOPMENT)
-        
-        # Get instance multiple times
-        instance1 = DatabaseAdapterFactory.get_instance()
-        instance2 = DatabaseAdapterFactory.get_instance()
-        
-        # Should be same instance
-        self.assertIs(instance1, instance2)
-        
-        # Reset and verify cleanup
-        DatabaseAdapterFactory.reset()
-        self.assertIsNone(DatabaseAdapterFactory._instance)
-        
-        # Should raise error after reset
-        with self.assertRaises(RuntimeError):
-            DatabaseAdapterFactory.get_instance()
-    
-    @patch('src.database.adapter_factory.GcpDatabaseAdapter')
-    def test_full_workflow_deployment(self, mock_gcp_adapter):
-        """Test complete workflow for deployment environment."""
-        mock_adapter = Mock(spec=GcpDatabaseAdapter)
-        mock_gcp_adapter.return_value = mock_adapter
-        
-        # Initialize factory
-        DatabaseAdapterFactory.initialize(DatabaseEnvironment.DEPLOYMENT)
-        
-        # Get instance
-        instance = DatabaseAdapterFactory.get_instance()
-        
-        self.assertIsNotNone(instance)
-        self.assertEqual(instance, mock_adapter)
-        
-        # Reset
-        DatabaseAdapterFactory.reset()
-        mock_adapter.close.assert_called_once()
-    
-    @patch('src.database.adapter_factory.LocalDatabaseAdapter')
-    @patch('src.database.adapter_factory.GcpDatabaseAdapter')
-    def test_switching_environments(self, mock_gcp_adapter, mock_local_adapter):
-        """Test switching between environments."""
-        mock_local = Mock(spec=LocalDatabaseAdapter)
-        mock_gcp = Mock(spec=GcpDatabaseAdapter)
-        mock_local_adapter.return_value = mock_local
-        mock_gcp_adapter.return_value = mock_gcp
-        
-        # Start with development
-        DatabaseAdapterFactory.initialize(DatabaseEnvironment.DEVELOPMENT)
-        instance1 = DatabaseAdapterFactory.get_instance()
-        self.assertEqual(instance1, mock_local)
-        
-        # Switch to deployment
+        local_instance = DatabaseAdapterFactory.get_instance()
         DatabaseAdapterFactory.initialize(DatabaseEnvironment.DEPLOYMENT)
-        instance2 = DatabaseAdapterFactory.get_instance()
-        self.assertEqual(instance2, mock_gcp)
+        gcp_instance = DatabaseAdapterFactory.get_instance()
         
-        # Instances should be different
-        self.assertIsNot(instance1, instance2)
+        self.assertIs(local_instance, mock_adapters['LocalDatabaseAdapter'].return_value)
+        self.assertIs(gcp_instance, mock_adapters['GcpDatabaseAdapter'].return_value)
+        self.assertIsNot(local_instance, gcp_instance)
 
 
 if __name__ == '__main__':
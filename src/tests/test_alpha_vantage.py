@@ -1,19 +1,56 @@
 # Disclaimer: Created by GitHub Copilot
 
+import copy
 import unittest
 from unittest.mock import patch, Mock, MagicMock
-from datetime import datetime, timezone
-import requests
+from datetime import datetime, timedelta, timezone
+from requests.exceptions import HTTPError, RequestException
 
 from src.external.alpha_vantage import AlphaVantage
+from src.external.external_base import ExternalApiBaseDefinition
 from src.models.stock_model import Stock
 from src.models.stock_event_model import StockEvent, EventType
 
 
+# Shared timestamp for fixtures; tests never depend on its exact value
+_NOW = datetime.now(timezone.utc)
+
+# Prototype client and stock built once; each test class works on its own copy
+with patch.object(ExternalApiBaseDefinition, '__init__', return_value=None):
+    _AV_PROTO = AlphaVantage()
+_AV_PROTO.api_key = 'test_api_key'
+
+_STOCK_PROTO = Stock(
+    name='Apple Inc',
+    symbol='AAPL',
+    last_updated=_NOW
+)
+
+
+def _mock_session_returning(content=b'', raise_exc=None):
+    '''Build a requests.Session mock whose get() returns a response with the given content.'''
+    response = Mock(content=content)
+    if raise_exc is not None:
+        response.raise_for_status.side_effect = raise_exc
+    session = MagicMock()
+    session.__enter__.return_value = session
+    session.get.return_value = response
+    return session
+
+
+def _json_response(payload=None, raise_exc=None):
+    '''Build a requests response mock whose json() returns the given payload.'''
+    response = Mock()
+    response.json.return_value = payload
+    if raise_exc is not None:
+        response.raise_for_status.side_effect = raise_exc
+    return response
+
+
+@patch.object(ExternalApiBaseDefinition, '__init__')
 class TestAlphaVantageInit(unittest.TestCase):
     '''Test AlphaVantage initialization.'''
     
-    @patch('src.external.alpha_vantage.ExternalApiBaseDefinition.__init__')
     def test_init_success(self, mock_super_init):
         '''Test successful initialization.'''
         mock_super_init.return_value = None
@@ -23,7 +60,6 @@ class TestAlphaVantageInit(unittest.TestCase):
         mock_super_init.assert_called_once_with(api_key_name='API_KEY_ALPHA_VANTAGE')
         self.assertEqual(av.source, 'AlphaVantage')
     
-    @patch('src.external.alpha_vantage.ExternalApiBaseDefinition.__init__')
     def test_init_raises_error_no_api_key(self, mock_super_init):
         '''Test initialization fails when API key is missing.'''
         mock_super_init.side_effect = ValueError("API key not found")
@@ -32,20 +68,18 @@ class TestAlphaVantageInit(unittest.TestCase):
             AlphaVantage()
 
 
+@patch('src.external.alpha_vantage.requests.get')
 class TestGetStockInfoFromName(unittest.TestCase):
     '''Test getStockInfoFromName method.'''
     
-    def setUp(self):
-        '''Set up test fixtures.'''
-        with patch('src.external.alpha_vantage.ExternalApiBaseDefinition.__init__', return_value=None):
-            self.av = AlphaVantage()
-            self.av.api_key = 'test_api_key'
+    @classmethod
+    def setUpClass(cls):
+        '''Set up test fixtures shared by all tests in the class.'''
+        cls.av = copy.copy(_AV_PROTO)
     
-    @patch('src.external.alpha_vantage.requests.get')
     def test_get_stock_info_from_name_success(self, mock_get):
         '''Test successful stock lookup by name.'''
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_get.return_value = _json_response({
             'bestMatches': [
                 {
                     '1. symbol': 'AAPL',
@@ -54,8 +88,7 @@ class TestGetStockInfoFromName(unittest.TestCase):
                     '4. region': 'United States'
                 }
             ]
-        }
-        mock_get.return_value = mock_response
+        })
         
         result = self.av.getStockInfoFromName(name='Apple')
         
@@ -65,62 +98,58 @@ class TestGetStockInfoFromName(unittest.TestCase):
         self.assertIsNotNone(result.last_updated)
         mock_get.assert_called_once()
     
-    @patch('src.external.alpha_vantage.requests.get')
     def test_get_stock_info_from_name_no_matches(self, mock_get):
         '''Test when no matches are found.'''
-        mock_response = Mock()
-        mock_response.json.return_value = {'bestMatches': []}
-        mock_get.return_value = mock_response
+        mock_get.return_value = _json_response({'bestMatches': []})
         
         with self.assertRaises(ValueError) as context:
             self.av.getStockInfoFromName(name='NonexistentCompany')
         
         self.assertIn('No stocks found', str(context.exception))
     
-    @patch('src.external.alpha_vantage.requests.get')
     def test_get_stock_info_from_name_invalid_data(self, mock_get):
         '''Test when API returns invalid data.'''
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_get.return_value = _json_response({
             'bestMatches': [
                 {
                     '1. symbol': '',
                     '2. name': ''
                 }
             ]
-        }
-        mock_get.return_value = mock_response
+        })
         
         with self.assertRaises(ValueError) as context:
             self.av.getStockInfoFromName(name='Test')
         
         self.assertIn('Invalid data', str(context.exception))
     
-    def test_get_stock_info_from_name_empty_string(self):
+    def test_get_stock_info_from_name_empty_string(self, mock_get):
         '''Test with empty name string.'''
         with self.assertRaises(ValueError) as context:
             self.av.getStockInfoFromName(name='')
         
         self.assertIn('Invalid name provided', str(context.exception))
+        mock_get.assert_not_called()
     
-    def test_get_stock_info_from_name_whitespace_only(self):
+    def test_get_stock_info_from_name_whitespace_only(self, mock_get):
         '''Test with whitespace-only name.'''
         with self.assertRaises(ValueError) as context:
             self.av.getStockInfoFromName(name='   ')
         
         self.assertIn('Invalid name provided', str(context.exception))
+        mock_get.assert_not_called()
     
-    def test_get_stock_info_from_name_wrong_type(self):
+    def test_get_stock_info_from_name_wrong_type(self, mock_get):
         '''Test with non-string type.'''
         with self.assertRaises(TypeError) as context:
             self.av.getStockInfoFromName(name=123) # pyright: ignore[reportArgumentType]
         
         self.assertIn('Name must be a string', str(context.exception))
+        mock_get.assert_not_called()
     
-    @patch('src.external.alpha_vantage.requests.get')
     def test_get_stock_info_from_name_api_error(self, mock_get):
         '''Test when API request fails.'''
-        mock_get.side_effect = requests.exceptions.RequestException("API Error")
+        mock_get.side_effect = RequestException("API Error")
         
         with self.assertRaises(ValueError) as context:
             self.av.getStockInfoFromName(name='Apple')
@@ -128,20 +157,18 @@ class TestGetStockInfoFromName(unittest.TestCase):
         self.assertIn('Network error fetching stock data', str(context.exception))
 
 
+@patch('src.external.alpha_vantage.requests.get')
 class TestGetStockInfoFromSymbol(unittest.TestCase):
     '''Test getStockInfoFromSymbol method.'''
     
-    def setUp(self):
-        '''Set up test fixtures.'''
-        with patch('src.external.alpha_vantage.ExternalApiBaseDefinition.__init__', return_value=None):
-            self.av = AlphaVantage()
-            self.av.api_key = 'test_api_key'
+    @classmethod
+    def setUpClass(cls):
+        '''Set up test fixtures shared by all tests in the class.'''
+        cls.av = copy.copy(_AV_PROTO)
     
-    @patch('src.external.alpha_vantage.requests.get')
     def test_get_stock_info_from_symbol_exact_match(self, mock_get):
         '''Test successful lookup with exact symbol match.'''
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_get.return_value = _json_response({
             'bestMatches': [
                 {
                     '1. symbol': 'AAPL',
@@ -154,8 +181,7 @@ class TestGetStockInfoFromSymbol(unittest.TestCase):
                     '3. type': 'Equity'
                 }
             ]
-        }
-        mock_get.return_value = mock_response
+        })
         
         result = self.av.getStockInfoFromSymbol(symbol='AAPL')
         
@@ -163,11 +189,9 @@ class TestGetStockInfoFromSymbol(unittest.TestCase):
         self.assertEqual(result.symbol, 'AAPL')
         self.assertEqual(result.name, 'Apple Inc')
     
-    @patch('src.external.alpha_vantage.requests.get')
     def test_get_stock_info_from_symbol_no_exact_match(self, mock_get):
         '''Test when no exact match but results exist.'''
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_get.return_value = _json_response({
             'bestMatches': [
                 {
                     '1. symbol': 'AAPL.LON',
@@ -175,19 +199,16 @@ class TestGetStockInfoFromSymbol(unittest.TestCase):
                     '3. type': 'Equity'
                 }
             ]
-        }
-        mock_get.return_value = mock_response
+        })
         
         result = self.av.getStockInfoFromSymbol(symbol='AAPL')
         
         # Should return first result when no exact match
         self.assertEqual(result.symbol, 'AAPL.LON')
     
-    @patch('src.external.alpha_vantage.requests.get')
     def test_get_stock_info_from_symbol_case_insensitive(self, mock_get):
         '''Test symbol matching is case insensitive.'''
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_get.return_value = _json_response({
             'bestMatches': [
                 {
                     '1. symbol': 'AAPL',
@@ -195,33 +216,31 @@ class TestGetStockInfoFromSymbol(unittest.TestCase):
                     '3. type': 'Equity'
                 }
             ]
-        }
-        mock_get.return_value = mock_response
+        })
         
         result = self.av.getStockInfoFromSymbol(symbol='aapl')
         
         self.assertEqual(result.symbol, 'AAPL')
     
-    def test_get_stock_info_from_symbol_empty_string(self):
+    def test_get_stock_info_from_symbol_empty_string(self, mock_get):
         '''Test with empty symbol.'''
         with self.assertRaises(ValueError) as context:
             self.av.getStockInfoFromSymbol(symbol='')
         
         self.assertIn('Invalid symbol provided', str(context.exception))
+        mock_get.assert_not_called()
     
-    def test_get_stock_info_from_symbol_wrong_type(self):
+    def test_get_stock_info_from_symbol_wrong_type(self, mock_get):
         '''Test with non-string type.'''
         with self.assertRaises(TypeError) as context:
             self.av.getStockInfoFromSymbol(symbol=None) # pyright: ignore[reportArgumentType]
         
         self.assertIn('Symbol must be a string', str(context.exception))
+        mock_get.assert_not_called()
     
-    @patch('src.external.alpha_vantage.requests.get')
     def test_get_stock_info_from_symbol_no_results(self, mock_get):
         '''Test when no results found.'''
-        mock_response = Mock()
-        mock_response.json.return_value = {'bestMatches': []}
-        mock_get.return_value = mock_response
+        mock_get.return_value = _json_response({'bestMatches': []})
         
         with self.assertRaises(ValueError) as context:
             self.av.getStockInfoFromSymbol(symbol='INVALID')
@@ -232,30 +251,27 @@ class TestGetStockInfoFromSymbol(unittest.TestCase):
 class TestGetStockEventDatesFromStock(unittest.TestCase):
     '''Test getStockEventDatesFromStock method.'''
     
-    def setUp(self):
-        '''Set up test fixtures.'''
-        with patch('src.external.alpha_vantage.ExternalApiBaseDefinition.__init__', return_value=None):
-            self.av = AlphaVantage()
-            self.av.api_key = 'test_api_key'
-            self.av.source = 'AlphaVantage'
-        
-        self.test_stock = Stock(
-            name='Apple Inc',
-            symbol='AAPL',
-            last_updated=datetime.now(timezone.utc)
+    @classmethod
+    def setUpClass(cls):
+        '''Set up test fixtures shared by all tests in the class.'''
+        cls.av = copy.copy(_AV_PROTO)
+        cls.test_stock = copy.copy(_STOCK_PROTO)
+    
+    def _mk_event(self, event_type, date):
+        '''Build an AlphaVantage event for the test stock.'''
+        return StockEvent(
+            stock=self.test_stock,
+            type=event_type,
+            date=date,
+            last_updated=_NOW,
+            source='AlphaVantage'
         )
     
     @patch.object(AlphaVantage, '_getEarningsAnnouncementsFromStock')
     def test_get_earnings_only(self, mock_earnings):
         '''Test fetching only earnings events.'''
         mock_earnings.return_value = [
-            StockEvent(
-                stock=self.test_stock,
-                type=EventType.EARNINGS_ANNOUNCEMENT,
-                date=datetime(2025, 11, 5, tzinfo=timezone.utc),
-                last_updated=datetime.now(timezone.utc),
-                source='AlphaVantage'
-            )
+            self._mk_event(EventType.EARNINGS_ANNOUNCEMENT, datetime(2025, 11, 5, tzinfo=timezone.utc))
         ]
         
         result = self.av.getStockEventDatesFromStock(
@@ -271,13 +287,7 @@ class TestGetStockEventDatesFromStock(unittest.TestCase):
     def test_get_splits_only(self, mock_splits):
         '''Test fetching only stock split events.'''
         mock_splits.return_value = [
-            StockEvent(
-                stock=self.test_stock,
-                type=EventType.STOCK_SPLIT,
-                date=datetime(2025, 11, 5, tzinfo=timezone.utc),
-                last_updated=datetime.now(timezone.utc),
-                source='AlphaVantage'
-            )
+            self._mk_event(EventType.STOCK_SPLIT, datetime(2025, 11, 5, tzinfo=timezone.utc))
         ]
         
         result = self.av.getStockEventDatesFromStock(
@@ -293,27 +303,9 @@ class TestGetStockEventDatesFromStock(unittest.TestCase):
         '''Test fetching dividends with filtering.'''
         # API returns all dividend types
         mock_dividends.return_value = [
-            StockEvent(
-                stock=self.test_stock,
-                type=EventType.DIVIDEND_EX,
-                date=datetime(2025, 11, 5, tzinfo=timezone.utc),
-                last_updated=datetime.now(timezone.utc),
-                source='AlphaVantage'
-            ),
-            StockEvent(
-                stock=self.test_stock,
-                type=EventType.DIVIDEND_PAYMENT,
-                date=datetime(2025, 11, 10, tzinfo=timezone.utc),
-                last_updated=datetime.now(timezone.utc),
-                source='AlphaVantage'
-            ),
-            StockEvent(
-                stock=self.test_stock,
-                type=EventType.DIVIDEND_DECLARATION,
-                date=datetime(2025, 11, 1, tzinfo=timezone.utc),
-                last_updated=datetime.now(timezone.utc),
-                source='AlphaVantage'
-            )
+            self._mk_event(EventType.DIVIDEND_EX, datetime(2025, 11, 5, tzinfo=timezone.utc)),
+            self._mk_event(EventType.DIVIDEND_PAYMENT, datetime(2025, 11, 10, tzinfo=timezone.utc)),
+            self._mk_event(EventType.DIVIDEND_DECLARATION, datetime(2025, 11, 1, tzinfo=timezone.utc))
         ]
         
         # Request only DIVIDEND_EX
@@ -331,22 +323,10 @@ class TestGetStockEventDatesFromStock(unittest.TestCase):
     def test_get_multiple_event_types(self, mock_splits, mock_earnings):
         '''Test fetching multiple event types.'''
         mock_earnings.return_value = [
-            StockEvent(
-                stock=self.test_stock,
-                type=EventType.EARNINGS_ANNOUNCEMENT,
-                date=datetime(2025, 11, 5, tzinfo=timezone.utc),
-                last_updated=datetime.now(timezone.utc),
-                source='AlphaVantage'
-            )
+            self._mk_event(EventType.EARNINGS_ANNOUNCEMENT, datetime(2025, 11, 5, tzinfo=timezone.utc))
         ]
         mock_splits.return_value = [
-            StockEvent(
-                stock=self.test_stock,
-                type=EventType.STOCK_SPLIT,
-                date=datetime(2025, 11, 10, tzinfo=timezone.utc),
-                last_updated=datetime.now(timezone.utc),
-                source='AlphaVantage'
-            )
+            self._mk_event(EventType.STOCK_SPLIT, datetime(2025, 11, 10, tzinfo=timezone.utc))
         ]
         
         result = self.av.getStockEventDatesFromStock(
@@ -400,44 +380,27 @@ class TestGetStockEventDatesFromStock(unittest.TestCase):
 class TestGetEarningsAnnouncementsFromStock(unittest.TestCase):
     '''Test _getEarningsAnnouncementsFromStock method.'''
     
-    def setUp(self):
-        '''Set up test fixtures.'''
-        with patch('src.external.alpha_vantage.ExternalApiBaseDefinition.__init__', return_value=None):
-            self.av = AlphaVantage()
-            self.av.api_key = 'test_api_key'
-            self.av.source = 'AlphaVantage'
-        
-        self.test_stock = Stock(
-            name='Apple Inc',
-            symbol='AAPL',
-            last_updated=datetime.now(timezone.utc)
-        )
+    @classmethod
+    def setUpClass(cls):
+        '''Set up test fixtures shared by all tests in the class.'''
+        cls.av = copy.copy(_AV_PROTO)
+        cls.test_stock = copy.copy(_STOCK_PROTO)
+        
+        # Upcoming report dates relative to today
+        report_date_1 = (_NOW + timedelta(days=30)).strftime('%Y-%m-%d')
+        fiscal_date_1 = (_NOW + timedelta(days=10)).strftime('%Y-%m-%d')
+        report_date_2 = (_NOW + timedelta(days=120)).strftime('%Y-%m-%d')
+        fiscal_date_2 = (_NOW + timedelta(days=90)).strftime('%Y-%m-%d')
+        cls.csv_upcoming = (
+            f"symbol,reportDate,fiscalDateEnding\n"
+            f"AAPL,{report_date_1},{fiscal_date_1}\n"
+            f"AAPL,{report_date_2},{fiscal_date_2}"
+        ).encode('utf-8')
     
     @patch('src.external.alpha_vantage.requests.Session')
     def test_get_earnings_success(self, mock_session):
         '''Test successful earnings fetch.'''
-        from datetime import timedelta
-
-        now = datetime.now(timezone.utc)
-        report_date_1 = (now + timedelta(days=30)).strftime('%Y-%m-%d')
-        fiscal_date_1 = (now + timedelta(days=10)).strftime('%Y-%m-%d')
-        report_date_2 = (now + timedelta(days=120)).strftime('%Y-%m-%d')
-        fiscal_date_2 = (now + timedelta(days=90)).strftime('%Y-%m-%d')
-        csv_data = (
-            f"symbol,reportDate,fiscalDateEnding\n"
-            f"AAPL,{report_date_1},{fiscal_date_1}\n"
-            f"AAPL,{report_date_2},{fiscal_date_2}"
-        )
-
-        mock_response = Mock()
-        mock_response.content = csv_data.encode('utf-8')
-        mock_response.raise_for_status = Mock()
-
-        mock_session_instance = Mock()
-        mock_session_instance.get.return_value = mock_response
-        mock_session_instance.__enter__ = Mock(return_value=mock_session_instance)
-        mock_session_instance.__exit__ = Mock(return_value=None)
-        mock_session.return_value = mock_session_instance
+        mock_session.return_value = _mock_session_returning(self.csv_upcoming)
 
         result = self.av._getEarningsAnnouncementsFromStock(stock=self.test_stock)
 
@@ -445,61 +408,12 @@ class TestGetEarningsAnnouncementsFromStock(unittest.TestCase):
         self.assertEqual(result[0].type, EventType.EARNINGS_ANNOUNCEMENT)
         self.assertEqual(result[0].stock, self.test_stock)
     
-    @patch('src.external.alpha_vantage.requests.Session')
-    def test_get_earnings_wrong_symbol(self, mock_session):
-        '''Test when CSV contains different symbol.'''
-        csv_data = "symbol,reportDate,fiscalDateEnding\nTSLA,2025-11-05,2025-09-30"
-        
-        mock_response = Mock()
-        mock_response.content = csv_data.encode('utf-8')
-        mock_response.raise_for_status = Mock()
-        
-        mock_session_instance = Mock()
-        mock_session_instance.get.return_value = mock_response
-        mock_session_instance.__enter__ = Mock(return_value=mock_session_instance)
-        mock_session_instance.__exit__ = Mock(return_value=None)
-        mock_session.return_value = mock_session_instance
-        
-        result = self.av._getEarningsAnnouncementsFromStock(stock=self.test_stock)
-        
-        # Should return empty list when symbol doesn't match
-        self.assertEqual(len(result), 0)
-    
-    @patch('src.external.alpha_vantage.requests.Session')
-    def test_get_earnings_invalid_date_format(self, mock_session):
-        '''Test handling of invalid date format.'''
-        csv_data = "symbol,reportDate,fiscalDateEnding\nAAPL,invalid-date,2025-09-30"
-        
-        mock_response = Mock()
-        mock_response.content = csv_data.encode('utf-8')
-        mock_response.raise_for_status = Mock()
-        
-        mock_session_instance = Mock()
-        mock_session_instance.get.return_value = mock_response
-        mock_session_instance.__enter__ = Mock(return_value=mock_session_instance)
-        mock_session_instance.__exit__ = Mock(return_value=None)
-        mock_session.return_value = mock_session_instance
-        
-        # Should skip invalid dates and return empty list
-        result = self.av._getEarningsAnnouncementsFromStock(stock=self.test_stock)
-        self.assertEqual(len(result), 0)
-    
-    def test_get_earnings_invalid_stock_type(self):
-        '''Test with invalid stock type.'''
-        with self.assertRaises(TypeError):
-            self.av._getEarningsAnnouncementsFromStock(stock="not a stock") # pyright: ignore[reportArgumentType]
-    
     @patch('src.external.alpha_vantage.requests.Session')
     def test_get_earnings_request_exception(self, mock_session):
         '''Test handling of request exception.'''
-        mock_response = Mock()
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("404 Not Found")
-        
-        mock_session_instance = Mock()
-        mock_session_instance.get.return_value = mock_response
-        mock_session_instance.__enter__ = Mock(return_value=mock_session_instance)
-        mock_session_instance.__exit__ = Mock(return_value=None)
-        mock_session.return_value = mock_session_instance
+        mock_session.return_value = _mock_session_returning(
+            raise_exc=HTTPError("404 Not Found")
+        )
         
         with self.assertRaises(ValueError) as context:
             self.av._getEarningsAnnouncementsFromStock(stock=self.test_stock)
@@ -510,24 +424,16 @@ class TestGetEarningsAnnouncementsFromStock(unittest.TestCase):
 class TestGetDividendsFromStock(unittest.TestCase):
     '''Test _getDividendsFromStock method.'''
     
-    def setUp(self):
-        '''Set up test fixtures.'''
-        with patch('src.external.alpha_vantage.ExternalApiBaseDefinition.__init__', return_value=None):
-            self.av = AlphaVantage()
-            self.av.api_key = 'test_api_key'
-            self.av.source = 'AlphaVantage'
-        
-        self.test_stock = Stock(
-            name='Apple Inc',
-            symbol='AAPL',
-            last_updated=datetime.now(timezone.utc)
-        )
+    @classmethod
+    def setUpClass(cls):
+        '''Set up test fixtures shared by all tests in the class.'''
+        cls.av = copy.copy(_AV_PROTO)
+        cls.test_stock = copy.copy(_STOCK_PROTO)
     
     @patch('src.external.alpha_vantage.requests.get')
     def test_get_dividends_success(self, mock_get):
         '''Test successful dividend fetch with all date types.'''
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_get.return_value = _json_response({
             'symbol': 'AAPL',
             'data': [
                 {
@@ -538,9 +444,7 @@ class TestGetDividendsFromStock(unittest.TestCase):
                     'amount': 0.25
                 }
             ]
-        }
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        })
         
         result = self.av._getDividendsFromStock(stock=self.test_stock)
         
@@ -557,8 +461,7 @@ class TestGetDividendsFromStock(unittest.TestCase):
     @patch('src.external.alpha_vantage.requests.get')
     def test_get_dividends_partial_dates(self, mock_get):
         '''Test when only some dividend dates are present.'''
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_get.return_value = _json_response({
             'symbol': 'AAPL',
             'data': [
                 {
@@ -566,58 +469,17 @@ class TestGetDividendsFromStock(unittest.TestCase):
                     'payment_date': '2025-11-15'
                 }
             ]
-        }
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        })
         
         result = self.av._getDividendsFromStock(stock=self.test_stock)
         
         # Should only create 2 events
         self.assertEqual(len(result), 2)
     
-    @patch('src.external.alpha_vantage.requests.get')
-    def test_get_dividends_wrong_symbol(self, mock_get):
-        '''Test when API returns different symbol.'''
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            'symbol': 'TSLA',
-            'data': []
-        }
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
-        
-        result = self.av._getDividendsFromStock(stock=self.test_stock)
-        
-        self.assertEqual(len(result), 0)
-    
-    @patch('src.external.alpha_vantage.requests.get')
-    def test_get_dividends_invalid_date(self, mock_get):
-        '''Test handling of invalid date format.'''
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            'symbol': 'AAPL',
-            'data': [
-                {
-                    'ex_dividend_date': 'invalid-date'
-                }
-            ]
-        }
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
-        
-        # Should skip invalid dates
-        result = self.av._getDividendsFromStock(stock=self.test_stock)
-        self.assertEqual(len(result), 0)
-    
-    def test_get_dividends_invalid_stock_type(self):
-        '''Test with invalid stock type.'''
-        with self.assertRaises(TypeError):
-            self.av._getDividendsFromStock(stock=None) # pyright: ignore[reportArgumentType]
-    
     @patch('src.external.alpha_vantage.requests.get')
     def test_get_dividends_request_exception(self, mock_get):
         '''Test handling of request exception.'''
-        mock_get.side_effect = requests.exceptions.RequestException("Network error")
+        mock_get.side_effect = RequestException("Network error")
         
         with self.assertRaises(ValueError) as context:
             self.av._getDividendsFromStock(stock=self.test_stock)
@@ -628,24 +490,16 @@ class TestGetDividendsFromStock(unittest.TestCase):
 class TestGetSplitsFromStock(unittest.TestCase):
     '''Test _getSplitsFromStock method.'''
     
-    def setUp(self):
-        '''Set up test fixtures.'''
-        with patch('src.external.alpha_vantage.ExternalApiBaseDefinition.__init__', return_value=None):
-            self.av = AlphaVantage()
-            self.av.api_key = 'test_api_key'
-            self.av.source = 'AlphaVantage'
-        
-        self.test_stock = Stock(
-            name='Apple Inc',
-            symbol='AAPL',
-            last_updated=datetime.now(timezone.utc)
-        )
+    @classmethod
+    def setUpClass(cls):
+        '''Set up test fixtures shared by all tests in the class.'''
+        cls.av = copy.copy(_AV_PROTO)
+        cls.test_stock = copy.copy(_STOCK_PROTO)
     
     @patch('src.external.alpha_vantage.requests.get')
     def test_get_splits_success(self, mock_get):
         '''Test successful stock split fetch.'''
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_get.return_value = _json_response({
             'symbol': 'AAPL',
             'data': [
                 {
@@ -657,9 +511,7 @@ class TestGetSplitsFromStock(unittest.TestCase):
                     'split_factor': '7:1'
                 }
             ]
-        }
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        })
         
         result = self.av._getSplitsFromStock(stock=self.test_stock)
         
@@ -670,69 +522,19 @@ class TestGetSplitsFromStock(unittest.TestCase):
     @patch('src.external.alpha_vantage.requests.get')
     def test_get_splits_empty_data(self, mock_get):
         '''Test when no splits exist.'''
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_get.return_value = _json_response({
             'symbol': 'AAPL',
             'data': []
-        }
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
-        
-        result = self.av._getSplitsFromStock(stock=self.test_stock)
-        
-        self.assertEqual(len(result), 0)
-    
-    @patch('src.external.alpha_vantage.requests.get')
-    def test_get_splits_wrong_symbol(self, mock_get):
-        '''Test when API returns different symbol.'''
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            'symbol': 'TSLA',
-            'data': [
-                {
-                    'effective_date': '2022-08-25',
-                    'split_factor': '3:1'
-                }
-            ]
-        }
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        })
         
         result = self.av._getSplitsFromStock(stock=self.test_stock)
         
         self.assertEqual(len(result), 0)
     
-    @patch('src.external.alpha_vantage.requests.get')
-    def test_get_splits_invalid_date(self, mock_get):
-        '''Test handling of invalid date format.'''
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            'symbol': 'AAPL',
-            'data': [
-                {
-                    'effective_date': 'not-a-date',
-                    'split_factor': '2:1'
-                }
-            ]
-        }
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
-        
-        # Should skip invalid dates
-        result = self.av._getSplitsFromStock(stock=self.test_stock)
-        self.assertEqual(len(result), 0)
-    
-    def test_get_splits_invalid_stock_type(self):
-        '''Test with invalid stock type.'''
-        with self.assertRaises(TypeError):
-            self.av._getSplitsFromStock(stock=123) # pyright: ignore[reportArgumentType]
-    
     @patch('src.external.alpha_vantage.requests.get')
     def test_get_splits_request_exception(self, mock_get):
         '''Test handling of request exception.'''
-        mock_response = Mock()
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("500 Server Error")
-        mock_get.return_value = mock_response
+        mock_get.return_value = _json_response(raise_exc=HTTPError("500 Server Error"))
         
         with self.assertRaises(ValueError) as context:
             self.av._getSplitsFromStock(stock=self.test_stock)
@@ -740,5 +542,58 @@ class TestGetSplitsFromStock(unittest.TestCase):
         self.assertIn('Error fetching split data', str(context.exception))
 
 
+class TestEventFetcherSharedScenarios(unittest.TestCase):
+    '''Scenarios shared by the earnings, dividend and split fetchers.'''
+    
+    # (case id, fetcher, patched requests attribute, response builder, payload)
+    EMPTY_RESULT_CASES = (
+        ('earnings_wrong_symbol', '_getEarningsAnnouncementsFromStock', 'Session',
+         _mock_session_returning,
+         b"symbol,reportDate,fiscalDateEnding\nTSLA,2025-11-05,2025-09-30"),
+        ('earnings_invalid_date', '_getEarningsAnnouncementsFromStock', 'Session',
+         _mock_session_returning,
+         b"symbol,reportDate,fiscalDateEnding\nAAPL,invalid-date,2025-09-30"),
+        ('dividends_wrong_symbol', '_getDividendsFromStock', 'get', _json_response,
+         {'symbol': 'TSLA', 'data': []}),
+        ('dividends_invalid_date', '_getDividendsFromStock', 'get', _json_response,
+         {'symbol': 'AAPL', 'data': [{'ex_dividend_date': 'invalid-date'}]}),
+        ('splits_wrong_symbol', '_getSplitsFromStock', 'get', _json_response,
+         {'symbol': 'TSLA', 'data': [{'effective_date': '2022-08-25', 'split_factor': '3:1'}]}),
+        ('splits_invalid_date', '_getSplitsFromStock', 'get', _json_response,
+         {'symbol': 'AAPL', 'data': [{'effective_date': 'not-a-date', 'split_factor': '2:1'}]}),
+    )
+    
+    # (fetcher, invalid stock argument)
+    INVALID_STOCK_CASES = (
+        ('_getEarningsAnnouncementsFromStock', "not a stock"),
+        ('_getDividendsFromStock', None),
+        ('_getSplitsFromStock', 123),
+    )
+    
+    @classmethod
+    def setUpClass(cls):
+        '''Set up test fixtures shared by all tests in the class.'''
+        cls.av = copy.copy(_AV_PROTO)
+        cls.test_stock = copy.copy(_STOCK_PROTO)
+    
+    def test_wrong_symbol_or_invalid_date_returns_empty(self):
+        '''Test that mismatched symbols and unparseable dates are skipped.'''
+        for case_id, fetcher, attribute, build_response, payload in self.EMPTY_RESULT_CASES:
+            with self.subTest(case_id), \
+                    patch(f'src.external.alpha_vantage.requests.{attribute}') as mock_request:
+                mock_request.return_value = build_response(payload)
+                
+                result = getattr(self.av, fetcher)(stock=self.test_stock)
+                
+                self.assertEqual(len(result), 0)
+    
+    def test_invalid_stock_type(self):
+        '''Test that every fetcher rejects non-Stock arguments.'''
+        for fetcher, invalid_stock in self.INVALID_STOCK_CASES:
+            with self.subTest(fetcher):
+                with self.assertRaises(TypeError):
+                    getattr(self.av, fetcher)(stock=invalid_stock)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -2,25 +2,210 @@
 
 import unittest
 import os
+import logging
+import json
+import functools
 from datetime import datetime, timezone
 from pathlib import Path
+from unittest.mock import patch
 from dotenv import load_dotenv
 import requests
+import vcr
 
 from src.external.alpha_vantage import AlphaVantage
 from src.models.stock_model import Stock
 from src.models.stock_event_model import StockEvent, EventType
 
-# Load environment variables from .env file
-load_dotenv(Path('.env'))
+# Progress details are logged at DEBUG; run with LOG_LEVEL=DEBUG to see them
+logger = logging.getLogger(__name__)
 
 
+def setUpModule():
+    '''Configure logging from LOG_LEVEL under any runner, not only when run as a script.'''
+    logging.basicConfig(level=os.getenv('LOG_LEVEL', 'WARNING').upper())
+
+
+@functools.cache
+def _load_env():
+    '''Load environment variables from the .env file once, on first use.'''
+    load_dotenv(Path('.env'))
+
+
+# Keys Alpha Vantage uses for rate-limit and quota notices sent with HTTP 200
+_RATE_LIMIT_KEYS = ('Note', 'Information')
+
+
+def _drop_rate_limit_notice(response):
+    '''
+    Keep rate-limit notices out of the cassettes.
+    
+    Alpha Vantage answers throttled requests with HTTP 200 and a JSON body
+    holding a "Note" or "Information" message. Recording one would replay the
+    notice on every later run, so those responses are not recorded.
+    '''
+    try:
+        body = json.loads(response['body']['string'])
+    except (ValueError, TypeError):
+        return response  # CSV payloads are real data
+    
+    if isinstance(body, dict) and any(key in body for key in _RATE_LIMIT_KEYS):
+        return None
+    return response
+
+
+# Recorded Alpha Vantage responses; delete a cassette to re-record it against the live API
+CASSETTE_DIR = Path(__file__).parent / 'fixtures' / 'alphavantage'
+_av_vcr = vcr.VCR(
+    cassette_library_dir=str(CASSETTE_DIR),
+    record_mode='once',
+    filter_query_parameters=['apikey'],
+    decode_compressed_response=True,
+    before_record_response=_drop_rate_limit_notice,
+)
+
+
+def _requires_alpha_vantage(cls):
+    '''
+    Class decorator that skips the class before setup unless it can run.
+    
+    A class runs when integration tests are enabled and either an API key is
+    available or its cassette has already been recorded.
+    '''
+    if os.getenv('SKIP_INTEGRATION_TESTS'):
+        return unittest.skip("Integration tests skipped (SKIP_INTEGRATION_TESTS is set)")(cls)
+    
+    _load_env()
+    if not os.getenv('API_KEY_ALPHA_VANTAGE') and not (CASSETTE_DIR / f'{cls.__name__}.yaml').exists():
+        return unittest.skip("API_KEY_ALPHA_VANTAGE not set and no recorded cassette")(cls)
+    
+    return cls
+
+
+def _enter_class_cassette(cls):
+    '''
+    Replay (or record) all requests of a test class from one cassette.
+    
+    Without an API key a placeholder is enough, because a recorded cassette
+    answers every request without reaching the network.
+    '''
+    if not os.getenv('API_KEY_ALPHA_VANTAGE'):
+        cls.enterClassContext(patch.dict(os.environ, {'API_KEY_ALPHA_VANTAGE': 'replay'}))
+    
+    cls.enterClassContext(_av_vcr.use_cassette(f'{cls.__name__}.yaml'))
+
+
+AV_QUERY_URL = 'https://www.alphavantage.co/query'
+
+_DIVIDEND_TYPES = frozenset({
+    EventType.DIVIDEND_EX,
+    EventType.DIVIDEND_DECLARATION,
+    EventType.DIVIDEND_RECORD,
+    EventType.DIVIDEND_PAYMENT,
+})
+_MULTI_TYPES = frozenset({
+    EventType.EARNINGS_ANNOUNCEMENT,
+    EventType.DIVIDEND_EX,
+    EventType.STOCK_SPLIT,
+})
+
+
+def _json(response):
+    '''Parse a JSON response body straight from bytes, skipping requests' encoding detection.'''
+    return json.loads(response.content)
+
+
+def _csv_header(response):
+    '''Read only the header line of a streamed CSV response.'''
+    return next(response.iter_lines(decode_unicode=True), '')
+
+
+def _assert_tz_datetime(test, value):
+    '''Verify a value is a timezone-aware datetime.'''
+    test.assertTrue(
+        isinstance(value, datetime) and value.tzinfo is not None,
+        f'expected tz-aware datetime, got {value!r}',
+    )
+
+
+def _assert_symbol_search(test, data):
+    '''Verify SYMBOL_SEARCH returns matches with symbol and name.'''
+    # Check response structure
+    test.assertIn('bestMatches', data)
+    test.assertTrue(data['bestMatches'], "No results in SYMBOL_SEARCH response")
+    match = data['bestMatches'][0]
+    
+    # Verify expected fields exist
+    test.assertIn('1. symbol', match)
+    test.assertIn('2. name', match)
+    
+    logger.debug("✓ SYMBOL_SEARCH format validated")
+    logger.debug("  Sample: %s (%s)", match.get('2. name'), match.get('1. symbol'))
+
+
+def _assert_earnings_calendar(test, header):
+    '''Verify EARNINGS_CALENDAR returns CSV with the expected headers.'''
+    test.assertTrue(header, "Empty EARNINGS_CALENDAR response")
+    
+    # Verify expected CSV headers
+    test.assertIn('symbol', header.lower())
+    test.assertIn('reportdate', header.lower())
+    
+    logger.debug("✓ EARNINGS_CALENDAR format validated (CSV)")
+    logger.debug("  Headers: %s...", header[:100])
+
+
+def _assert_dividends(test, data):
+    '''Verify DIVIDENDS returns entries with at least one date field.'''
+    # Check response structure
+    test.assertEqual(data.get('symbol'), 'AAPL', "Unexpected DIVIDENDS response format")
+    test.assertTrue(data.get('data'), "No dividend data in response")
+    dividend = data['data'][0]
+    
+    # Verify expected fields
+    # Note: Not all fields may be present for all dividends
+    expected_fields = ['ex_dividend_date', 'declaration_date', 
+                     'record_date', 'payment_date']
+    
+    has_date_field = any(field in dividend for field in expected_fields)
+    test.assertTrue(has_date_field, "At least one date field should be present")
+    
+    logger.debug("✓ DIVIDENDS format validated")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("  Available fields: %s", ', '.join(dividend.keys()))
+
+
+def _assert_splits(test, data):
+    '''Verify SPLITS returns entries with an effective date.'''
+    # Check response structure
+    test.assertEqual(data.get('symbol'), 'AAPL', "Unexpected SPLITS response format")
+    test.assertTrue(data.get('data'), "No split data in response")
+    split = data['data'][0]
+    
+    # Verify expected fields
+    test.assertIn('effective_date', split)
+    
+    logger.debug("✓ SPLITS format validated")
+    logger.debug("  Sample split date: %s", split.get('effective_date'))
+
+
+# (function, query parameters, body parser, format assertion)
+AV_FORMAT_CASES = [
+    ('SYMBOL_SEARCH', {'keywords': 'Apple'}, _json, _assert_symbol_search),
+    ('EARNINGS_CALENDAR', {'symbol': 'AAPL', 'horizon': '3month'}, _csv_header, _assert_earnings_calendar),
+    ('DIVIDENDS', {'symbol': 'AAPL'}, _json, _assert_dividends),
+    ('SPLITS', {'symbol': 'AAPL'}, _json, _assert_splits),
+]
+
+
+@_requires_alpha_vantage
 class TestAlphaVantageIntegration(unittest.TestCase):
     '''
     Integration tests for AlphaVantage API.
     
     These tests make real API calls and require a valid API key.
     Set the API_KEY_ALPHA_VANTAGE environment variable before running.
+    Responses are recorded to src/tests/fixtures/alphavantage on the first
+    run and replayed from there afterwards, without needing the key.
     
     Run with:
         python -m unittest tests.test_alpha_vantage_integration -v
@@ -31,14 +216,13 @@ class TestAlphaVantageIntegration(unittest.TestCase):
     
     @classmethod
     def setUpClass(cls):
-        '''Set up test class - check for API key.'''
-        if os.getenv('SKIP_INTEGRATION_TESTS'):
-            raise unittest.SkipTest("Integration tests skipped (SKIP_INTEGRATION_TESTS is set)")
-        
-        if not os.getenv('API_KEY_ALPHA_VANTAGE'):
-            raise unittest.SkipTest("API_KEY_ALPHA_VANTAGE not set - skipping integration tests")
+        '''Set up test class.'''
+        _enter_class_cassette(cls)
         
         cls.av = AlphaVantage()
+        
+        # Fetched once so the event tests don't each spend a SYMBOL_SEARCH request
+        cls._aapl = cls.av.getStockInfoFromSymbol(symbol='AAPL')
     
     def test_get_stock_info_from_name_apple(self):
         '''Test fetching Apple Inc by company name.'''
@@ -59,10 +243,9 @@ class TestAlphaVantageIntegration(unittest.TestCase):
         self.assertIn('AAPL', result.symbol)
         
         # Verify last_updated is a datetime with timezone
-        self.assertIsInstance(result.last_updated, datetime)
-        self.assertIsNotNone(result.last_updated.tzinfo)
+        _assert_tz_datetime(self, result.last_updated)
         
-        print(f"✓ Found stock by name: {result.name} ({result.symbol})")
+        logger.debug("✓ Found stock by name: %s (%s)", result.name, result.symbol)
     
     def test_get_stock_info_from_symbol_aapl(self):
         '''Test fetching Apple by ticker symbol.'''
@@ -82,7 +265,7 @@ class TestAlphaVantageIntegration(unittest.TestCase):
         # Verify name is not empty
         self.assertTrue(len(result.name) > 0)
         
-        print(f"✓ Found stock by symbol: {result.name} ({result.symbol})")
+        logger.debug("✓ Found stock by symbol: %s (%s)", result.name, result.symbol)
     
     def test_get_stock_info_from_symbol_microsoft(self):
         '''Test fetching Microsoft by ticker symbol.'''
@@ -92,12 +275,12 @@ class TestAlphaVantageIntegration(unittest.TestCase):
         self.assertEqual(result.symbol.upper(), 'MSFT')
         self.assertIn('Microsoft', result.name)
         
-        print(f"✓ Found stock: {result.name} ({result.symbol})")
+        logger.debug("✓ Found stock: %s (%s)", result.name, result.symbol)
     
     def test_get_earnings_announcements(self):
         '''Test fetching earnings announcements for Apple.'''
         # First get the stock
-        stock = self.av.getStockInfoFromSymbol(symbol='AAPL')
+        stock = self._aapl
         
         # Fetch earnings
         result = self.av.getStockEventDatesFromStock(
@@ -107,69 +290,52 @@ class TestAlphaVantageIntegration(unittest.TestCase):
         
         # Verify it returns a list
         self.assertIsInstance(result, list)
+        self.assertTrue(result, "No earnings announcements found")
         
-        if len(result) > 0:
-            # Verify first item is a StockEvent
-            self.assertIsInstance(result[0], StockEvent)
-            
-            # Verify event properties
-            self.assertEqual(result[0].type, EventType.EARNINGS_ANNOUNCEMENT)
-            self.assertEqual(result[0].stock, stock)
-            self.assertIsInstance(result[0].date, datetime)
-            self.assertIsNotNone(result[0].date.tzinfo)
-            self.assertIsInstance(result[0].last_updated, datetime)
-            self.assertEqual(result[0].source, 'AlphaVantage')
-            
-            print(f"✓ Found {len(result)} earnings announcement(s)")
-            print(f"  First earnings date: {result[0].date.strftime('%Y-%m-%d')}")
-        else:
-            print("⚠ No earnings announcements found (API may have rate limits)")
+        # Verify first item is a StockEvent
+        self.assertIsInstance(result[0], StockEvent)
+        
+        # Verify event properties
+        self.assertEqual(result[0].type, EventType.EARNINGS_ANNOUNCEMENT)
+        self.assertEqual(result[0].stock, stock)
+        _assert_tz_datetime(self, result[0].date)
+        self.assertIsInstance(result[0].last_updated, datetime)
+        self.assertEqual(result[0].source, 'AlphaVantage')
+        
+        logger.debug("✓ Found %s earnings announcement(s)", len(result))
+        logger.debug("  First earnings date: %s", result[0].date.date())
     
     def test_get_dividends(self):
         '''Test fetching dividend events for Apple.'''
         # Apple pays regular dividends
-        stock = self.av.getStockInfoFromSymbol(symbol='AAPL')
+        stock = self._aapl
         
         # Fetch dividends
         result = self.av.getStockEventDatesFromStock(
             stock=stock,
-            event_types=[
-                EventType.DIVIDEND_EX,
-                EventType.DIVIDEND_DECLARATION,
-                EventType.DIVIDEND_RECORD,
-                EventType.DIVIDEND_PAYMENT
-            ]
+            event_types=list(_DIVIDEND_TYPES)
         )
         
         # Verify it returns a list
         self.assertIsInstance(result, list)
+        self.assertTrue(result, "No dividend events found")
         
-        if len(result) > 0:
-            # Check that we have dividend events
-            dividend_types = {event.type for event in result}
-            self.assertTrue(len(dividend_types) > 0)
-            
-            # Verify all are dividend types
-            for event in result:
-                self.assertIn(event.type, [
-                    EventType.DIVIDEND_EX,
-                    EventType.DIVIDEND_DECLARATION,
-                    EventType.DIVIDEND_RECORD,
-                    EventType.DIVIDEND_PAYMENT
-                ])
-                self.assertEqual(event.stock, stock)
-                self.assertIsInstance(event.date, datetime)
-                self.assertEqual(event.source, 'AlphaVantage')
-            
-            print(f"✓ Found {len(result)} dividend event(s)")
-            print(f"  Event types: {', '.join([et.name for et in dividend_types])}")
-        else:
-            print("⚠ No dividend events found (API may have rate limits)")
+        # Verify all are dividend types
+        dividend_types = {event.type for event in result}
+        for event in result:
+            self.assertIn(event.type, _DIVIDEND_TYPES)
+            self.assertEqual(event.stock, stock)
+            self.assertIsInstance(event.date, datetime)
+            self.assertEqual(event.source, 'AlphaVantage')
+        
+        logger.debug("✓ Found %s dividend event(s)", len(result))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  Event types: %s", ', '.join([et.name for et in dividend_types]))
     
     def test_get_stock_splits(self):
         '''Test fetching stock splits for Apple.'''
         # Apple has had stock splits (most recently in 2020)
-        stock = self.av.getStockInfoFromSymbol(symbol='AAPL')
+        stock = self._aapl
         
         # Fetch splits
         result = self.av.getStockEventDatesFromStock(
@@ -179,57 +345,44 @@ class TestAlphaVantageIntegration(unittest.TestCase):
         
         # Verify it returns a list
         self.assertIsInstance(result, list)
+        self.assertTrue(result, "No stock splits found")
         
-        if len(result) > 0:
-            # Verify events
-            for event in result:
-                self.assertIsInstance(event, StockEvent)
-                self.assertEqual(event.type, EventType.STOCK_SPLIT)
-                self.assertEqual(event.stock, stock)
-                self.assertIsInstance(event.date, datetime)
-                self.assertEqual(event.source, 'AlphaVantage')
-            
-            print(f"✓ Found {len(result)} stock split(s)")
-            # Print most recent split
-            if result:
-                recent = max(result, key=lambda e: e.date)
-                print(f"  Most recent split: {recent.date.strftime('%Y-%m-%d')}")
-        else:
-            print("⚠ No stock splits found (API may have rate limits)")
+        # Verify events
+        for event in result:
+            self.assertIsInstance(event, StockEvent)
+            self.assertEqual(event.type, EventType.STOCK_SPLIT)
+            self.assertEqual(event.stock, stock)
+            self.assertIsInstance(event.date, datetime)
+            self.assertEqual(event.source, 'AlphaVantage')
+        
+        logger.debug("✓ Found %s stock split(s)", len(result))
+        # Log most recent split
+        if logger.isEnabledFor(logging.DEBUG):
+            recent = max(result, key=lambda e: e.date)
+            logger.debug("  Most recent split: %s", recent.date.date())
     
     def test_get_multiple_event_types(self):
         '''Test fetching multiple event types in one call.'''
-        stock = self.av.getStockInfoFromSymbol(symbol='AAPL')
+        stock = self._aapl
         
         # Fetch multiple event types
         result = self.av.getStockEventDatesFromStock(
             stock=stock,
-            event_types=[
-                EventType.EARNINGS_ANNOUNCEMENT,
-                EventType.DIVIDEND_EX,
-                EventType.STOCK_SPLIT
-            ]
+            event_types=list(_MULTI_TYPES)
         )
         
         # Verify it returns a list
         self.assertIsInstance(result, list)
+        self.assertTrue(result, "No events found")
         
-        if len(result) > 0:
-            # Check event types
-            event_types = {event.type for event in result}
-            
-            # Verify all events are from requested types
-            for event in result:
-                self.assertIn(event.type, [
-                    EventType.EARNINGS_ANNOUNCEMENT,
-                    EventType.DIVIDEND_EX,
-                    EventType.STOCK_SPLIT
-                ])
-            
-            print(f"✓ Found {len(result)} total event(s)")
-            print(f"  Event types returned: {', '.join([et.name for et in event_types])}")
-        else:
-            print("⚠ No events found (API may have rate limits)")
+        # Verify all events are from requested types
+        event_types = {event.type for event in result}
+        for event in result:
+            self.assertIn(event.type, _MULTI_TYPES)
+        
+        logger.debug("✓ Found %s total event(s)", len(result))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  Event types returned: %s", ', '.join([et.name for et in event_types]))
     
     def test_api_rate_limiting(self):
         '''Test that API handles rate limits gracefully.'''
@@ -239,7 +392,7 @@ class TestAlphaVantageIntegration(unittest.TestCase):
             # Make a simple request
             result = self.av.getStockInfoFromSymbol(symbol='AAPL')
             self.assertIsInstance(result, Stock)
-            print("✓ API request succeeded (within rate limits)")
+            logger.debug("✓ API request succeeded (within rate limits)")
         except ValueError as e:
             # Check if it's a rate limit error
             error_msg = str(e).lower()
@@ -257,16 +410,16 @@ class TestAlphaVantageIntegration(unittest.TestCase):
             # If it returns something, verify it's a Stock object
             # (API might return close matches)
             self.assertIsInstance(result, Stock)
-            print(f"⚠ API returned close match: {result.symbol}")
+            logger.debug("⚠ API returned close match: %s", result.symbol)
             
         except ValueError as e:
             # Expected behavior - no matches found
             self.assertIn('No stock data found', str(e))
-            print("✓ Invalid symbol correctly rejected")
+            logger.debug("✓ Invalid symbol correctly rejected")
     
     def test_response_data_structure(self):
         '''Test that API responses have expected structure.'''
-        stock = self.av.getStockInfoFromSymbol(symbol='AAPL')
+        stock = self._aapl
         
         # Test Stock object structure
         self.assertTrue(hasattr(stock, 'name'))
@@ -282,31 +435,32 @@ class TestAlphaVantageIntegration(unittest.TestCase):
         self.assertTrue(len(stock.name) > 0)
         self.assertTrue(len(stock.symbol) > 0)
         
-        print("✓ Stock object has correct structure")
+        logger.debug("✓ Stock object has correct structure")
         
         # Test StockEvent structure
         events = self.av.getStockEventDatesFromStock(
             stock=stock,
             event_types=[EventType.EARNINGS_ANNOUNCEMENT]
         )
-        
-        if len(events) > 0:
-            event = events[0]
-            self.assertTrue(hasattr(event, 'stock'))
-            self.assertTrue(hasattr(event, 'type'))
-            self.assertTrue(hasattr(event, 'date'))
-            self.assertTrue(hasattr(event, 'last_updated'))
-            self.assertTrue(hasattr(event, 'source'))
-            
-            self.assertIsInstance(event.stock, Stock)
-            self.assertIsInstance(event.type, EventType)
-            self.assertIsInstance(event.date, datetime)
-            self.assertIsInstance(event.last_updated, datetime)
-            self.assertIsInstance(event.source, str)
-            
-            print("✓ StockEvent object has correct structure")
+        self.assertTrue(events, "No earnings announcements found")
+        
+        event = events[0]
+        self.assertTrue(hasattr(event, 'stock'))
+        self.assertTrue(hasattr(event, 'type'))
+        self.assertTrue(hasattr(event, 'date'))
+        self.assertTrue(hasattr(event, 'last_updated'))
+        self.assertTrue(hasattr(event, 'source'))
+        
+        self.assertIsInstance(event.stock, Stock)
+        self.assertIsInstance(event.type, EventType)
+        self.assertIsInstance(event.date, datetime)
+        self.assertIsInstance(event.last_updated, datetime)
+        self.assertIsInstance(event.source, str)
+        
+        logger.debug("✓ StockEvent object has correct structure")
 
 
+@_requires_alpha_vantage
 class TestAlphaVantageAPIResponseFormats(unittest.TestCase):
     '''
     Tests to verify Alpha Vantage API response formats match expectations.
@@ -318,110 +472,32 @@ class TestAlphaVantageAPIResponseFormats(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         '''Set up test class.'''
-        if os.getenv('SKIP_INTEGRATION_TESTS'):
-            raise unittest.SkipTest("Integration tests skipped")
-        
-        if not os.getenv('API_KEY_ALPHA_VANTAGE'):
-            raise unittest.SkipTest("API_KEY_ALPHA_VANTAGE not set")
+        _enter_class_cassette(cls)
         
         cls.av = AlphaVantage()
-    
-    def test_symbol_search_response_format(self):
-        '''Verify SYMBOL_SEARCH API returns expected format.'''
-        
-        url = f'https://www.alphavantage.co/query?function=SYMBOL_SEARCH&keywords=Apple&apikey={self.av.api_key}'
-        response = requests.get(url)
-        data = response.json()
-        
-        # Check response structure
-        self.assertIn('bestMatches', data)
         
-        if len(data['bestMatches']) > 0:
-            match = data['bestMatches'][0]
-            
-            # Verify expected fields exist
-            self.assertIn('1. symbol', match)
-            self.assertIn('2. name', match)
-            
-            print(f"✓ SYMBOL_SEARCH format validated")
-            print(f"  Sample: {match.get('2. name')} ({match.get('1. symbol')})")
-        else:
-            print("⚠ No results in SYMBOL_SEARCH response")
+        # One session so the format checks share a pooled TLS connection
+        cls.session = requests.Session()
     
-    def test_earnings_calendar_response_format(self):
-        '''Verify EARNINGS_CALENDAR API returns CSV format.'''
-        
-        url = f'https://www.alphavantage.co/query?function=EARNINGS_CALENDAR&symbol=AAPL&horizon=3month&apikey={self.av.api_key}'
-        response = requests.get(url)
-        content = response.content.decode('utf-8')
-        
-        # Check it's CSV format
-        lines = content.strip().split('\n')
-        
-        if len(lines) > 0:
-            header = lines[0]
-            
-            # Verify expected CSV headers
-            self.assertIn('symbol', header.lower())
-            self.assertIn('reportdate', header.lower())
-            
-            print(f"✓ EARNINGS_CALENDAR format validated (CSV)")
-            print(f"  Headers: {header[:100]}...")
-        else:
-            print("⚠ Empty EARNINGS_CALENDAR response")
-    
-    def test_dividends_response_format(self):
-        '''Verify DIVIDENDS API returns expected JSON format.'''
-        
-        url = f'https://www.alphavantage.co/query?function=DIVIDENDS&symbol=AAPL&apikey={self.av.api_key}'
-        response = requests.get(url)
-        data = response.json()
-        
-        # Check response structure
-        if 'symbol' in data:
-            self.assertEqual(data['symbol'], 'AAPL')
-            
-            if 'data' in data and len(data['data']) > 0:
-                dividend = data['data'][0]
-                
-                # Verify expected fields
-                # Note: Not all fields may be present for all dividends
-                expected_fields = ['ex_dividend_date', 'declaration_date', 
-                                 'record_date', 'payment_date']
-                
-                has_date_field = any(field in dividend for field in expected_fields)
-                self.assertTrue(has_date_field, "At least one date field should be present")
-                
-                print(f"✓ DIVIDENDS format validated")
-                print(f"  Available fields: {', '.join(dividend.keys())}")
-            else:
-                print("⚠ No dividend data in response")
-        else:
-            print("⚠ Unexpected DIVIDENDS response format")
+    @classmethod
+    def tearDownClass(cls):
+        '''Close the shared HTTP session.'''
+        cls.session.close()
     
-    def test_splits_response_format(self):
-        '''Verify SPLITS API returns expected JSON format.'''
-        
-        url = f'https://www.alphavantage.co/query?function=SPLITS&symbol=AAPL&apikey={self.av.api_key}'
-        response = requests.get(url)
-        data = response.json()
-        
-        # Check response structure
-        if 'symbol' in data:
-            self.assertEqual(data['symbol'], 'AAPL')
-            
-            if 'data' in data and len(data['data']) > 0:
-                split = data['data'][0]
-                
-                # Verify expected fields
-                self.assertIn('effective_date', split)
+    def test_response_formats(self):
+        '''Verify each Alpha Vantage endpoint still returns the expected format.'''
+        for function, params, parse, check_format in AV_FORMAT_CASES:
+            with self.subTest(function=function):
+                # Streamed so the CSV check can stop after the header line
+                with self.session.get(
+                    AV_QUERY_URL,
+                    params={'function': function, **params, 'apikey': self.av.api_key},
+                    stream=True,
+                    timeout=10,
+                ) as response:
+                    body = parse(response)
                 
-                print(f"✓ SPLITS format validated")
-                print(f"  Sample split date: {split.get('effective_date')}")
-            else:
-                print("⚠ No split data in response")
-        else:
-            print("⚠ Unexpected SPLITS response format")
+                check_format(self, body)
 
 
 if __name__ == '__main__':
@@ -436,6 +512,8 @@ if __name__ == '__main__':
     print("  - Subject to API rate limits (5 requests/minute, 25/day for free tier)")
     print("\nTo skip these tests:")
     print("  export SKIP_INTEGRATION_TESTS=1")
+    print("\nTo see per-test details:")
+    print("  export LOG_LEVEL=DEBUG")
     print("\n" + "="*70 + "\n")
     
     unittest.main(verbosity=2)
@@ -2,42 +2,47 @@
 
 import unittest
 from datetime import datetime, timezone, timedelta
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, patch
 from src.app.background.tasks import update_stale_stock_events
+from src.app.services.stocks_service import StocksService
+from src.database.adapter_base import DatabaseAdapterBaseDefinition
 from src.models.stock_model import Stock
 from src.models.stock_event_model import EventType
 
+_ALL_EVENT_TYPES = tuple(EventType)
+_ALL_EVENT_TYPES_LEN = len(_ALL_EVENT_TYPES)
+
+# Stale rows shared by the tests; a few ms of drift within one run is irrelevant
+_OLD_DATE = datetime.now(timezone.utc) - timedelta(days=10)
+_STALE_ROWS_2 = (
+    {'ticker': 'AAPL', 'name': 'Apple Inc.', 'last_updated': _OLD_DATE},
+    {'ticker': 'MSFT', 'name': 'Microsoft Corporation', 'last_updated': _OLD_DATE},
+)
+
 
 class TestBackgroundTasks(unittest.TestCase):
     '''Test suite for background tasks.'''
     
-    @patch('src.app.background.tasks.DatabaseAdapterFactory')
-    @patch('src.app.background.tasks.StocksService')
-    def test_update_stale_stock_events_success(self, mock_stocks_service_class, mock_db_factory):
+    def setUp(self):
+        '''Patch the database factory and stocks service with spec'd mocks.'''
+        self.mock_db = MagicMock(spec=DatabaseAdapterBaseDefinition)
+        self.mock_stocks_service = MagicMock(spec=StocksService)
+        
+        db_factory_patcher = patch('src.app.background.tasks.DatabaseAdapterFactory')
+        mock_db_factory = db_factory_patcher.start()
+        self.addCleanup(db_factory_patcher.stop)
+        mock_db_factory.get_instance.return_value = self.mock_db
+        
+        stocks_service_patcher = patch('src.app.background.tasks.StocksService', return_value=self.mock_stocks_service)
+        stocks_service_patcher.start()
+        self.addCleanup(stocks_service_patcher.stop)
+    
+    def test_update_stale_stock_events_success(self):
         '''Test successful update of stale stock events.'''
         # Arrange
-        mock_db = Mock()
-        mock_db_factory.get_instance.return_value = mock_db
-        
-        # Mock stale stocks from database
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=7)
-        old_date = datetime.now(timezone.utc) - timedelta(days=10)
-        
-        mock_db.execute_query.return_value = [
-            {
-                'ticker': 'AAPL',
-                'name': 'Apple Inc.',
-                'last_updated': old_date,
-            },
-            {
-                'ticker': 'MSFT',
-                'name': 'Microsoft Corporation',
-                'last_updated': old_date,
-            },
-        ]
-        
-        mock_stocks_service = Mock()
-        mock_stocks_service_class.return_value = mock_stocks_service
+        mock_db = self.mock_db
+        mock_stocks_service = self.mock_stocks_service
+        mock_db.execute_query.return_value = list(_STALE_ROWS_2)
         
         # Act
         update_stale_stock_events()
@@ -59,23 +64,18 @@ class TestBackgroundTasks(unittest.TestCase):
         # Verify all event types were requested
         for call in calls:
             event_types = call[1]['event_types']
-            self.assertEqual(len(event_types), len(list(EventType)))
+            self.assertEqual(len(event_types), _ALL_EVENT_TYPES_LEN)
         
         # Verify last_updated was updated for each stock
         self.assertEqual(mock_db.execute_update.call_count, 2)
     
-    @patch('src.app.background.tasks.DatabaseAdapterFactory')
-    @patch('src.app.background.tasks.StocksService')
-    def test_update_stale_stock_events_no_stale_stocks(self, mock_stocks_service_class, mock_db_factory):
+    def test_update_stale_stock_events_no_stale_stocks(self):
         '''Test when there are no stale stocks to update.'''
         # Arrange
-        mock_db = Mock()
-        mock_db_factory.get_instance.return_value = mock_db
+        mock_db = self.mock_db
+        mock_stocks_service = self.mock_stocks_service
         mock_db.execute_query.return_value = []
         
-        mock_stocks_service = Mock()
-        mock_stocks_service_class.return_value = mock_stocks_service
-        
         # Act
         update_stale_stock_events()
         
@@ -85,26 +85,20 @@ class TestBackgroundTasks(unittest.TestCase):
         
         # Verify no updates were attempted
         self.assertEqual(mock_stocks_service.upsert_stock_events.call_count, 0)
-        self.assertEqual(mock_db.execute_update.call_count, 0)
+        mock_db.execute_update.assert_not_called()
     
-    @patch('src.app.background.tasks.DatabaseAdapterFactory')
-    @patch('src.app.background.tasks.StocksService')
     @patch('src.app.background.tasks.logger')
-    def test_update_stale_stock_events_partial_failure(self, mock_logger, mock_stocks_service_class, mock_db_factory):
+    def test_update_stale_stock_events_partial_failure(self, mock_logger):
         '''Test that task continues even if some stocks fail to update.'''
         # Arrange
-        mock_db = Mock()
-        mock_db_factory.get_instance.return_value = mock_db
-        
-        old_date = datetime.now(timezone.utc) - timedelta(days=10)
+        mock_db = self.mock_db
+        mock_stocks_service = self.mock_stocks_service
         mock_db.execute_query.return_value = [
-            {'ticker': 'AAPL', 'name': 'Apple Inc.', 'last_updated': old_date},
-            {'ticker': 'FAIL', 'name': 'Fail Corp.', 'last_updated': old_date},
-            {'ticker': 'MSFT', 'name': 'Microsoft Corporation', 'last_updated': old_date},
+            _STALE_ROWS_2[0],
+            {'ticker': 'FAIL', 'name': 'Fail Corp.', 'last_updated': _OLD_DATE},
+            _STALE_ROWS_2[1],
         ]
         
-        mock_stocks_service = Mock()
-        
         # Make the second stock fail
         def upsert_side_effect(*args, **kwargs):
             stock = kwargs.get('stock')
@@ -112,7 +106,6 @@ class TestBackgroundTasks(unittest.TestCase):
                 raise Exception("API error")
         
         mock_stocks_service.upsert_stock_events.side_effect = upsert_side_effect
-        mock_stocks_service_class.return_value = mock_stocks_service
         
         # Act
         update_stale_stock_events()
@@ -128,6 +121,29 @@ class TestBackgroundTasks(unittest.TestCase):
         
         # Verify successful stocks were still updated (only 2 updates, not 3)
         self.assertEqual(mock_db.execute_update.call_count, 2)
+    
+    @patch('src.app.background.tasks.logger')
+    def test_update_stale_stock_events_timestamp_update_failure(self, mock_logger):
+        '''Test that a failed last_updated write only counts that stock as an error.'''
+        # Arrange: the first UPDATE fails, the second succeeds
+        mock_db = self.mock_db
+        mock_db.execute_query.return_value = list(_STALE_ROWS_2)
+        mock_db.execute_update.side_effect = [Exception('Database connection lost'), 1]
+        
+        # Act: the failure is logged, not raised
+        update_stale_stock_events()
+        
+        # Assert
+        self.assertEqual(mock_db.execute_update.call_count, 2)
+        self.assertEqual(self.mock_stocks_service.upsert_stock_events.call_count, 2)
+        
+        error_messages = [call.args[0] for call in mock_logger.error.call_args_list]
+        self.assertEqual(len(error_messages), 1)
+        self.assertIn('AAPL', error_messages[0])
+        self.assertIn('Database connection lost', error_messages[0])
+        
+        summary = mock_logger.info.call_args_list[-1].args[0]
+        self.assertIn('Success: 1, Errors: 1, Total: 2', summary)
 
 
 if __name__ == '__main__':
@@ -18,6 +18,8 @@ from src.database.adapter_factory import DatabaseAdapterFactory, DatabaseEnviron
 from src.models.stock_model import Stock
 from src.models.stock_event_model import StockEvent, EventType
 
+_ALL_EVENT_TYPES_LEN = len(EventType)
+
 
 @unittest.skipIf(
     os.getenv('SKIP_DB_INTEGRATION_TESTS') == '1',
@@ -47,10 +49,14 @@ class TestBackgroundTasksIntegration(unittest.TestCase):
             port=int(os.getenv('DB_PORT', 5432)),
             database=os.getenv('DB_NAME', 'ticker_calendar_local_dev_db'),
             user=os.getenv('DB_USER', 'ticker_dev'),
-            password=os.getenv('DB_PASSWORD', 'dev_password_123')
+            password=os.getenv('DB_PASSWORD', 'dev_password_123'),
+            # The tests issue statements one at a time, so one pooled connection is enough
+            pool_size=1,
+            max_overflow=1,
         )
         
-        # Verify database is accessible
+        # Verify database is accessible; this also opens the pooled connection
+        # that every later statement of the class reuses
         if not cls.adapter.health_check():
             raise unittest.SkipTest('Database is not accessible')
         
@@ -58,70 +64,76 @@ class TestBackgroundTasksIntegration(unittest.TestCase):
         DatabaseAdapterFactory.initialize(environment=DatabaseEnvironment.DEVELOPMENT)
         
         cls.test_tickers = []
+        
+        # One external API mock for the whole class; tests only set its return values
+        cls.mock_external_api = Mock()
+        cls.enterClassContext(patch(
+            'src.app.services.stocks_service.ExternalApiFacade',
+            return_value=cls.mock_external_api,
+        ))
     
     @classmethod
     def tearDownClass(cls):
         '''Clean up test data.'''
         # Clean up test stocks and their events
-        for ticker in cls.test_tickers:
-            try:
-                # Delete stock events first (due to foreign key)
-                cls.adapter.execute_update(
-                    query="DELETE FROM stock_events WHERE stock_ticker = :ticker",
-                    params={'ticker': ticker}
-                )
-                # Delete stock
-                cls.adapter.execute_update(
-                    query="DELETE FROM stocks WHERE ticker = :ticker",
-                    params={'ticker': ticker}
-                )
-            except Exception:
-                pass  # Ignore cleanup errors
+        cls._delete_test_stocks(cls.test_tickers)
         
         cls.adapter.close()
     
     def setUp(self):
         '''Set up for each test.'''
-        # Clean up any existing test data
+        self.mock_external_api.reset_mock(return_value=True, side_effect=True)
+        
+        # Clean up any existing test data. This is the only per-test cleanup:
+        # each test starts from a clean slate and tearDownClass removes what the last one left.
         self._cleanup_test_stocks()
     
-    def tearDown(self):
-        '''Clean up after each test.'''
-        self._cleanup_test_stocks()
+    @classmethod
+    def _delete_test_stocks(cls, tickers):
+        '''Delete the given test stocks and their events in two statements.'''
+        if not tickers:
+            return
+        try:
+            # Delete stock events first (due to foreign key)
+            cls.adapter.execute_update(
+                query="DELETE FROM stock_events WHERE stock_ticker = ANY(:tickers)",
+                params={'tickers': list(tickers)}
+            )
+            cls.adapter.execute_update(
+                query="DELETE FROM stocks WHERE ticker = ANY(:tickers)",
+                params={'tickers': list(tickers)}
+            )
+        except Exception:
+            pass  # Ignore cleanup errors
     
     def _cleanup_test_stocks(self):
         '''Remove test stocks from database.'''
-        test_tickers = ['TESTSTOCK1', 'TESTSTOCK2', 'TESTSTOCK3', 'STALETEST']
-        for ticker in test_tickers:
-            try:
-                self.adapter.execute_update(
-                    query="DELETE FROM stock_events WHERE stock_ticker = :ticker",
-                    params={'ticker': ticker}
-                )
-                self.adapter.execute_update(
-                    query="DELETE FROM stocks WHERE ticker = :ticker",
-                    params={'ticker': ticker}
-                )
-            except Exception:
-                pass
+        self._delete_test_stocks(['TESTSTOCK1', 'TESTSTOCK2', 'TESTSTOCK3', 'STALETEST'])
     
-    def _insert_test_stock(self, ticker, name, last_updated):
-        '''Helper to insert a test stock into the database.'''
+    def _insert_test_stocks(self, rows):
+        '''Helper to insert several (ticker, name, last_updated) test stocks with one INSERT.'''
+        values = ', '.join(f'(:ticker{i}, :name{i}, :last_updated{i})' for i in range(len(rows)))
+        params = {}
+        for i, (ticker, name, last_updated) in enumerate(rows):
+            params[f'ticker{i}'] = ticker
+            params[f'name{i}'] = name
+            params[f'last_updated{i}'] = last_updated
+        
         self.adapter.execute_update(
-            query="""
+            query=f"""
                 INSERT INTO stocks (ticker, name, last_updated)
-                VALUES (:ticker, :name, :last_updated)
+                VALUES {values}
                 ON CONFLICT (ticker) DO UPDATE
                 SET name = EXCLUDED.name,
                     last_updated = EXCLUDED.last_updated
             """,
-            params={
-                'ticker': ticker,
-                'name': name,
-                'last_updated': last_updated,
-            }
+            params=params
         )
-        self.test_tickers.append(ticker)
+        self.test_tickers.extend(ticker for ticker, _, _ in rows)
+    
+    def _insert_test_stock(self, ticker, name, last_updated):
+        '''Helper to insert a test stock into the database.'''
+        self._insert_test_stocks([(ticker, name, last_updated)])
     
     @patch('src.app.background.tasks.StocksService')
     def test_update_stale_stock_events_with_real_database(self, mock_stocks_service_class):
@@ -131,12 +143,12 @@ class TestBackgroundTasksIntegration(unittest.TestCase):
         stale_date = now - timedelta(days=10)  # 10 days old (stale)
         fresh_date = now - timedelta(days=3)   # 3 days old (fresh)
         
-        # Insert stale stock
-        self._insert_test_stock('TESTSTOCK1', 'Test Stock 1', stale_date)
-        self._insert_test_stock('TESTSTOCK2', 'Test Stock 2', stale_date)
-        
-        # Insert fresh stock (should not be updated)
-        self._insert_test_stock('TESTSTOCK3', 'Test Stock 3', fresh_date)
+        # Insert two stale stocks and one fresh stock (should not be updated)
+        self._insert_test_stocks([
+            ('TESTSTOCK1', 'Test Stock 1', stale_date),
+            ('TESTSTOCK2', 'Test Stock 2', stale_date),
+            ('TESTSTOCK3', 'Test Stock 3', fresh_date),
+        ])
         
         # Mock the StocksService to avoid real API calls
         mock_service = Mock()
@@ -158,48 +170,43 @@ class TestBackgroundTasksIntegration(unittest.TestCase):
         # Verify all event types were requested for each stock
         for call in calls:
             event_types = call[1]['event_types']
-            self.assertEqual(len(event_types), len(list(EventType)))
+            self.assertEqual(len(event_types), _ALL_EVENT_TYPES_LEN)
     
-    @patch('src.app.services.stocks_service.ExternalApiFacade')
-    def test_update_stale_stock_events_updates_timestamp(self, mock_external_api_class):
+    def test_update_stale_stock_events_updates_timestamp(self):
         '''Test that last_updated timestamp is updated after processing.'''
-        # Arrange: Insert a stale stock
-        stale_date = datetime.now(timezone.utc) - timedelta(days=10)
+        # Arrange: Insert a stale stock; `now` also marks the time before running the task
+        now = datetime.now(timezone.utc)
+        stale_date = now - timedelta(days=10)
         self._insert_test_stock('STALETEST', 'Stale Test Corp', stale_date)
         
         # Mock the external API to return empty events
-        mock_external_api = Mock()
-        mock_external_api.getStockEventDatesFromStock.return_value = []
-        mock_external_api_class.return_value = mock_external_api
-        
-        # Record the time before running the task
-        time_before = datetime.now(timezone.utc)
+        self.mock_external_api.getStockEventDatesFromStock.return_value = []
         
         # Act: Run the background task
         update_stale_stock_events()
         
         # Assert: Verify the stock's last_updated was updated
-        result = list(self.adapter.execute_query(
-            query="SELECT last_updated FROM stocks WHERE ticker = :ticker",
+        row = next(iter(self.adapter.execute_query(
+            query="SELECT last_updated FROM stocks WHERE ticker = :ticker LIMIT 1",
             params={'ticker': 'STALETEST'}
-        ))
-        
-        self.assertEqual(len(result), 1)
-        updated_time = result[0]['last_updated']
+        )), None)
+
+        self.assertIsNotNone(row)
+        updated_time = row['last_updated']
         
         # Parse datetime if returned as string
         if isinstance(updated_time, str):
             updated_time = datetime.fromisoformat(updated_time)
         
         # Verify the timestamp was updated to a recent time
-        self.assertGreater(updated_time, time_before - timedelta(seconds=10))
+        self.assertGreater(updated_time, now - timedelta(seconds=10))
         self.assertGreater(updated_time, stale_date)
     
-    @patch('src.app.services.stocks_service.ExternalApiFacade')
-    def test_update_stale_stock_events_stores_events(self, mock_external_api_class):
+    def test_update_stale_stock_events_stores_events(self):
         '''Test that stock events are actually stored in the database.'''
         # Arrange: Insert a stale stock
-        stale_date = datetime.now(timezone.utc) - timedelta(days=10)
+        now = datetime.now(timezone.utc)
+        stale_date = now - timedelta(days=10)
         self._insert_test_stock('TESTSTOCK1', 'Test Stock 1', stale_date)
         
         # Create a Stock object for the mock events
@@ -210,48 +217,42 @@ class TestBackgroundTasksIntegration(unittest.TestCase):
         )
         
         # Mock the external API to return test events
-        mock_external_api = Mock()
-        test_event_date = datetime.now(timezone.utc)
-        current_time = datetime.now(timezone.utc)
         mock_events = [
             StockEvent(
                 stock=test_stock,
                 type=EventType.EARNINGS_ANNOUNCEMENT,
-                date=test_event_date,
-                last_updated=current_time,
+                date=now,
+                last_updated=now,
                 source='test_api'
             ),
             StockEvent(
                 stock=test_stock,
                 type=EventType.DIVIDEND_PAYMENT,
-                date=test_event_date,
-                last_updated=current_time,
+                date=now,
+                last_updated=now,
                 source='test_api'
             ),
         ]
-        mock_external_api.getStockEventDatesFromStock.return_value = mock_events
-        mock_external_api_class.return_value = mock_external_api
+        self.mock_external_api.getStockEventDatesFromStock.return_value = mock_events
         
         # Act: Run the background task
         update_stale_stock_events()
         
-        # Assert: Verify events were stored in database
-        events = list(self.adapter.execute_query(
+        # Assert: Verify events were stored in database, aggregated server-side into one row
+        row = next(iter(self.adapter.execute_query(
             query="""
-                SELECT type, event_date, source 
+                SELECT count(*) AS n, array_agg(type::text) AS types
                 FROM stock_events 
                 WHERE stock_ticker = :ticker
             """,
             params={'ticker': 'TESTSTOCK1'}
-        ))
+        )))
         
         # Should have at least the events we mocked
-        self.assertGreaterEqual(len(events), 2)
+        self.assertGreaterEqual(row['n'], 2)
         
         # Verify event types
-        event_types = [e['type'] for e in events]
-        self.assertIn('EARNINGS_ANNOUNCEMENT', event_types)
-        self.assertIn('DIVIDEND_PAYMENT', event_types)
+        self.assertLessEqual({'EARNINGS_ANNOUNCEMENT', 'DIVIDEND_PAYMENT'}, set(row['types']))
     
     @patch('src.app.background.tasks.StocksService')
     def test_update_stale_stock_events_empty_database(self, mock_stocks_service_class):
@@ -4,57 +4,84 @@ Unit tests for calendar REST endpoints.
 '''
 
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, create_autospec
 from http import HTTPStatus
+from uuid import UUID
 from flask import Flask
+from werkzeug.exceptions import HTTPException
 
-from src.api.routes.calendar_rest import calendar_bp, get_calendar_service
+import src.api.routes.calendar_rest as calendar_rest_module
+from src.api.routes.calendar_rest import calendar_bp, get_calendar_service, CalendarSubscription
+from src.app.services.calendar_service import CalendarService
+
+
+# (id, service side effect, service return value, expected status) cases for GET /calendar/<token>.ics
+_GET_CALENDAR_ERROR_CASES = (
+    ('value_error', ValueError('Invalid token format'), None, HTTPStatus.BAD_REQUEST),
+    ('lookup_error', LookupError('Watchlist not found'), None, HTTPStatus.NOT_FOUND),
+    ('generic_error', Exception('Database error'), None, HTTPStatus.INTERNAL_SERVER_ERROR),
+    ('empty_content', None, '', HTTPStatus.NOT_FOUND),
+)
+
+# Calendar body returned by the mocked service, and the bytes the route should send
+_ICS_CONTENT = 'BEGIN:VCALENDAR\r\nVERSION:2.0\r\nEND:VCALENDAR\r\n'
+_ICS_BYTES = _ICS_CONTENT.encode('ascii')
+
+# Headers that keep calendar clients from caching the subscription feed
+_NO_CACHE_HEADERS = {
+    'Cache-Control': 'no-cache, no-store, must-revalidate',
+    'Pragma': 'no-cache',
+    'Expires': '0',
+}
 
 
 class TestCalendarRest(unittest.TestCase):
     '''Test calendar REST endpoints.'''
     
+    @classmethod
+    def setUpClass(cls):
+        '''Create the Flask app and test client once for the class.'''
+        cls.app = Flask(__name__)
+        cls.app.register_blueprint(calendar_bp, url_prefix='/calendar')
+        cls.client = cls.app.test_client()
+        cls.test_token = 'test_secure_token_abc123'
+        cls.calendar_url = f'/calendar/{cls.test_token}.ics'
+        cls.mock_service = create_autospec(CalendarService, instance=True)
+    
     def setUp(self):
         '''Set up test fixtures.'''
-        # Create a Flask app for testing
-        self.app = Flask(__name__)
-        self.app.register_blueprint(calendar_bp, url_prefix='/calendar')
-        self.client = self.app.test_client()
-        self.test_token = 'test_secure_token_abc123'
-        
         # Mock JWT verification
         self.jwt_patcher = patch('flask_jwt_extended.view_decorators.verify_jwt_in_request')
         self.mock_jwt_verify = self.jwt_patcher.start()
+        self.addCleanup(self.jwt_patcher.stop)
+        
+        # Mock the calendar service lookup used by the route
+        get_service_patcher = patch('src.api.routes.calendar_rest.get_calendar_service')
+        self.mock_get_service = get_service_patcher.start()
+        self.addCleanup(get_service_patcher.stop)
+        self.mock_service.reset_mock(return_value=True, side_effect=True)
+        self.mock_get_service.return_value = self.mock_service
     
-    def tearDown(self):
-        self.jwt_patcher.stop()
-
-    @patch('src.api.routes.calendar_rest.get_calendar_service')
-    def test_get_calendar_success(self, mock_get_service):
+    def test_get_calendar_success(self):
         '''Test successful calendar retrieval.'''
-        mock_service = Mock()
-        mock_get_service.return_value = mock_service
-        
-        ics_content = 'BEGIN:VCALENDAR\r\nVERSION:2.0\r\nEND:VCALENDAR\r\n'
-        mock_service.get_calendar.return_value = ics_content
+        self.mock_service.get_calendar.return_value = _ICS_CONTENT
         
-        response = self.client.get(f'/calendar/{self.test_token}.ics')
+        response = self.client.get(self.calendar_url)
         
         # Verify service was called
-        mock_service.get_calendar.assert_called_once_with(token=self.test_token)
+        self.mock_service.get_calendar.assert_called_once_with(token=self.test_token)
         
         # Verify response
         self.assertEqual(response.status_code, HTTPStatus.OK)
         self.assertEqual(response.mimetype, 'text/calendar')
-        self.assertEqual(response.get_data(as_text=True), ics_content)
+        self.assertEqual(response.data, _ICS_BYTES)
         
         # Verify headers
-        self.assertIn('Content-Disposition', response.headers)
-        self.assertIn(self.test_token, response.headers['Content-Disposition'])
-        self.assertEqual(response.headers['Cache-Control'], 'no-cache, no-store, must-revalidate')
+        headers = dict(response.headers)
+        self.assertIn(self.test_token, headers.get('Content-Disposition', ''))
+        self.assertEqual(headers.get('Cache-Control'), _NO_CACHE_HEADERS['Cache-Control'])
     
-    @patch('src.api.routes.calendar_rest.get_calendar_service')
-    def test_get_calendar_empty_token(self, mock_get_service):
+    def test_get_calendar_empty_token(self):
         '''Test retrieval with empty token (URL would be invalid anyway).'''
         # Flask won't match the route with empty token, so this tests the route pattern
         response = self.client.get('/calendar/.ics')
@@ -62,94 +89,52 @@ class TestCalendarRest(unittest.TestCase):
         # Should return 404 as route won't match
         self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
     
-    @patch('src.api.routes.calendar_rest.get_calendar_service')
-    def test_get_calendar_value_error(self, mock_get_service):
-        '''Test handling of ValueError from service.'''
-        mock_service = Mock()
-        mock_get_service.return_value = mock_service
-        mock_service.get_calendar.side_effect = ValueError('Invalid token format')
-        
-        response = self.client.get(f'/calendar/{self.test_token}.ics')
-        
-        # Should return BAD_REQUEST
-        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+    def test_get_calendar_error_mapping(self):
+        '''Test that service errors and empty content map to the right status codes.'''
+        for case_id, side_effect, return_value, expected_status in _GET_CALENDAR_ERROR_CASES:
+            with self.subTest(case_id):
+                self.mock_service.get_calendar.side_effect = side_effect
+                self.mock_service.get_calendar.return_value = return_value
+                
+                response = self.client.get(self.calendar_url)
+                
+                self.assertEqual(response.status_code, expected_status)
     
-    @patch('src.api.routes.calendar_rest.get_calendar_service')
-    def test_get_calendar_lookup_error(self, mock_get_service):
-        '''Test handling of LookupError from service.'''
-        mock_service = Mock()
-        mock_get_service.return_value = mock_service
-        mock_service.get_calendar.side_effect = LookupError('Watchlist not found')
-        
-        response = self.client.get(f'/calendar/{self.test_token}.ics')
-        
-        # Should return NOT_FOUND
-        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
-    
-    @patch('src.api.routes.calendar_rest.get_calendar_service')
-    def test_get_calendar_generic_error(self, mock_get_service):
-        '''Test handling of generic exceptions from service.'''
-        mock_service = Mock()
-        mock_get_service.return_value = mock_service
-        mock_service.get_calendar.side_effect = Exception('Database error')
-        
-        response = self.client.get(f'/calendar/{self.test_token}.ics')
-        
-        # Should return INTERNAL_SERVER_ERROR
-        self.assertEqual(response.status_code, HTTPStatus.INTERNAL_SERVER_ERROR)
-    
-    @patch('src.api.routes.calendar_rest.get_calendar_service')
-    def test_get_calendar_empty_content(self, mock_get_service):
-        '''Test handling of empty calendar content.'''
-        mock_service = Mock()
-        mock_get_service.return_value = mock_service
-        mock_service.get_calendar.return_value = ''
-        
-        response = self.client.get(f'/calendar/{self.test_token}.ics')
-        
-        # Should return NOT_FOUND for empty content
-        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
-    
-    @patch('src.api.routes.calendar_rest.get_calendar_service')
-    def test_get_calendar_trims_token(self, mock_get_service):
+    def test_get_calendar_trims_token(self):
         '''Test that token is trimmed before processing.'''
-        mock_service = Mock()
-        mock_get_service.return_value = mock_service
-        mock_service.get_calendar.return_value = 'BEGIN:VCALENDAR\r\nEND:VCALENDAR\r\n'
+        self.mock_service.get_calendar.return_value = 'BEGIN:VCALENDAR\r\nEND:VCALENDAR\r\n'
         
-        # Token with spaces in URL (URL encoded)
-        response = self.client.get('/calendar/%20%20token_with_spaces%20%20.ics')
+        # Call the view directly; routing is covered by the end-to-end tests above
+        with self.app.test_request_context('/calendar/%20%20token_with_spaces%20%20.ics'):
+            response = CalendarSubscription().get('  token_with_spaces  ')
         
         # Verify service was called with trimmed token
-        mock_service.get_calendar.assert_called_once_with(token='token_with_spaces')
+        self.mock_service.get_calendar.assert_called_once_with(token='token_with_spaces')
         self.assertEqual(response.status_code, HTTPStatus.OK)
     
-    @patch('src.api.routes.calendar_rest.get_calendar_service')
-    def test_get_calendar_response_headers(self, mock_get_service):
+    def test_get_calendar_response_headers(self):
         '''Test that response has correct headers for calendar subscription.'''
-        mock_service = Mock()
-        mock_get_service.return_value = mock_service
-        mock_service.get_calendar.return_value = 'BEGIN:VCALENDAR\r\nEND:VCALENDAR\r\n'
+        self.mock_service.get_calendar.return_value = 'BEGIN:VCALENDAR\r\nEND:VCALENDAR\r\n'
         
-        response = self.client.get(f'/calendar/{self.test_token}.ics')
+        response = self.client.get(self.calendar_url)
+        
+        headers = dict(response.headers)
         
         # Verify cache control headers
-        self.assertEqual(response.headers['Cache-Control'], 'no-cache, no-store, must-revalidate')
-        self.assertEqual(response.headers['Pragma'], 'no-cache')
-        self.assertEqual(response.headers['Expires'], '0')
+        self.assertEqual({name: headers.get(name) for name in _NO_CACHE_HEADERS}, _NO_CACHE_HEADERS)
         
         # Verify content disposition
-        self.assertIn('attachment', response.headers['Content-Disposition'])
-        self.assertIn('.ics', response.headers['Content-Disposition'])
+        self.assertRegex(headers['Content-Disposition'], r'^attachment;.*\.ics')
     
     @patch('src.api.routes.calendar_rest.CalendarService')
     def test_get_calendar_service_singleton(self, mock_calendar_service_class):
         '''Test that calendar service is a singleton.'''
-        # Reset the global service
-        import src.api.routes.calendar_rest as calendar_rest_module
+        # Reset the global service, restoring the previous one afterwards
+        previous_service = calendar_rest_module.calendar_service
+        self.addCleanup(setattr, calendar_rest_module, 'calendar_service', previous_service)
         calendar_rest_module.calendar_service = None
         
-        mock_service_instance = Mock()
+        mock_service_instance = Mock(spec=CalendarService)
         mock_calendar_service_class.return_value = mock_service_instance
         
         # Call get_calendar_service multiple times
@@ -162,61 +147,67 @@ class TestCalendarRest(unittest.TestCase):
         # Should only instantiate once
         mock_calendar_service_class.assert_called_once()
     
-    @patch('src.api.routes.calendar_rest.get_calendar_service')
-    def test_get_calendar_whitespace_only_token(self, mock_get_service):
+    def test_get_calendar_whitespace_only_token(self):
         '''Test retrieval with whitespace-only token.'''
-        mock_service = Mock()
-        mock_get_service.return_value = mock_service
-        mock_service.get_calendar.return_value = 'BEGIN:VCALENDAR\r\nEND:VCALENDAR\r\n'
+        self.mock_service.get_calendar.return_value = 'BEGIN:VCALENDAR\r\nEND:VCALENDAR\r\n'
         
-        # URL with spaces (will be trimmed)
-        response = self.client.get('/calendar/%20%20%20.ics')
+        # Token with only spaces (will be trimmed), calling the view directly
+        with self.app.test_request_context('/calendar/%20%20%20.ics'):
+            with self.assertRaises(HTTPException) as context:
+                CalendarSubscription().get('   ')
         
         # Should be rejected as empty after trimming
-        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(context.exception.code, HTTPStatus.BAD_REQUEST)
+        self.mock_service.get_calendar.assert_not_called()
 
 
 class TestCalendarWatchlistRotateToken(unittest.TestCase):
     '''Test calendar token rotation endpoint.'''
     
+    @classmethod
+    def setUpClass(cls):
+        '''Create the Flask app, test client, ids and service mock once for the class.'''
+        cls.app = Flask(__name__)
+        cls.app.register_blueprint(calendar_bp, url_prefix='/calendar')
+        cls.client = cls.app.test_client()
+        
+        cls.test_watchlist_id = '3fa85f64-5717-4562-b3fc-2c963f66afa6'
+        cls.test_user_id = '1234abcd-5678-1234-9012-abcdef123456'
+        cls.user_uuid = UUID(cls.test_user_id)
+        cls.rotate_url = f'/calendar/{cls.test_watchlist_id}'
+        cls.mock_service = create_autospec(CalendarService, instance=True)
+    
     def setUp(self):
         '''Set up test fixtures.'''
-        # Create a Flask app for testing
-        self.app = Flask(__name__)
-        self.app.register_blueprint(calendar_bp, url_prefix='/calendar')
-        self.client = self.app.test_client()
-        self.test_watchlist_id = '3fa85f64-5717-4562-b3fc-2c963f66afa6'
-        self.test_user_id = '1234abcd-5678-1234-9012-abcdef123456'
-        
         # Mock JWT verification
         self.jwt_patcher = patch('flask_jwt_extended.view_decorators.verify_jwt_in_request')
         self.mock_jwt_verify = self.jwt_patcher.start()
+        self.addCleanup(self.jwt_patcher.stop)
+        
+        # Mock the current user lookup
+        user_id_patcher = patch('src.api.routes.calendar_rest.auth_utils.get_current_user_id')
+        self.mock_get_user_id = user_id_patcher.start()
+        self.addCleanup(user_id_patcher.stop)
+        self.mock_get_user_id.return_value = self.user_uuid
+        
+        # Mock the calendar service lookup used by the route
+        get_service_patcher = patch('src.api.routes.calendar_rest.get_calendar_service')
+        self.mock_get_service = get_service_patcher.start()
+        self.addCleanup(get_service_patcher.stop)
+        self.mock_service.reset_mock(return_value=True, side_effect=True)
+        self.mock_get_service.return_value = self.mock_service
     
-    def tearDown(self):
-        self.jwt_patcher.stop()
-    
-    @patch('src.api.routes.calendar_rest.auth_utils.get_current_user_id')
-    @patch('src.api.routes.calendar_rest.get_calendar_service')
-    def test_rotate_token_success(self, mock_get_service, mock_get_user_id):
+    def test_rotate_token_success(self):
         '''Test successful token rotation.'''
-        from uuid import UUID
-        
-        mock_user_id = UUID(self.test_user_id)
-        mock_get_user_id.return_value = mock_user_id
-        
-        mock_service = Mock()
-        mock_get_service.return_value = mock_service
-        
         new_token = 'new_secure_token_xyz789'
-        mock_service.rotate_calendar_token.return_value = new_token
+        self.mock_service.rotate_calendar_token.return_value = new_token
         
-        with self.app.test_request_context():
-            response = self.client.post(f'/calendar/{self.test_watchlist_id}')
+        response = self.client.post(self.rotate_url)
         
         # Verify service was called correctly
-        mock_service.rotate_calendar_token.assert_called_once()
-        call_kwargs = mock_service.rotate_calendar_token.call_args.kwargs
-        self.assertEqual(call_kwargs['user_id'], mock_user_id)
+        self.mock_service.rotate_calendar_token.assert_called_once()
+        call_kwargs = self.mock_service.rotate_calendar_token.call_args.kwargs
+        self.assertEqual(call_kwargs['user_id'], self.user_uuid)
         self.assertEqual(str(call_kwargs['watchlist_id']), self.test_watchlist_id)
         
         # Verify response
@@ -228,72 +219,38 @@ class TestCalendarWatchlistRotateToken(unittest.TestCase):
         self.assertIn(new_token, data['calendar_url'])
         self.assertIn('.ics', data['calendar_url'])
     
-    @patch('src.api.routes.calendar_rest.auth_utils.get_current_user_id')
-    @patch('src.api.routes.calendar_rest.get_calendar_service')
-    def test_rotate_token_constructs_url(self, mock_get_service, mock_get_user_id):
+    def test_rotate_token_constructs_url(self):
         '''Test that full calendar URL is constructed correctly.'''
-        from uuid import UUID
-        
-        mock_get_user_id.return_value = UUID(self.test_user_id)
-        
-        mock_service = Mock()
-        mock_get_service.return_value = mock_service
-        
         new_token = 'test_token_123'
-        mock_service.rotate_calendar_token.return_value = new_token
+        self.mock_service.rotate_calendar_token.return_value = new_token
         
-        with self.app.test_request_context():
-            response = self.client.post(f'/calendar/{self.test_watchlist_id}')
+        response = self.client.post(self.rotate_url)
         
         data = response.get_json()
         self.assertIn('/api/cal/', data['calendar_url'])
         self.assertTrue(data['calendar_url'].endswith(f'{new_token}.ics'))
     
-    @patch('src.api.routes.calendar_rest.auth_utils.get_current_user_id')
-    @patch('src.api.routes.calendar_rest.get_calendar_service')
-    def test_rotate_token_value_error(self, mock_get_service, mock_get_user_id):
+    def test_rotate_token_value_error(self):
         '''Test handling of ValueError from service.'''
-        from uuid import UUID
-        
-        mock_get_user_id.return_value = UUID(self.test_user_id)
-        
-        mock_service = Mock()
-        mock_get_service.return_value = mock_service
-        mock_service.rotate_calendar_token.side_effect = ValueError('Invalid watchlist ID')
+        self.mock_service.rotate_calendar_token.side_effect = ValueError('Invalid watchlist ID')
         
-        response = self.client.post(f'/calendar/{self.test_watchlist_id}')
+        response = self.client.post(self.rotate_url)
         
         self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
     
-    @patch('src.api.routes.calendar_rest.auth_utils.get_current_user_id')
-    @patch('src.api.routes.calendar_rest.get_calendar_service')
-    def test_rotate_token_lookup_error(self, mock_get_service, mock_get_user_id):
+    def test_rotate_token_lookup_error(self):
         '''Test handling of LookupError from service.'''
-        from uuid import UUID
+        self.mock_service.rotate_calendar_token.side_effect = LookupError('Watchlist not found')
         
-        mock_get_user_id.return_value = UUID(self.test_user_id)
-        
-        mock_service = Mock()
-        mock_get_service.return_value = mock_service
-        mock_service.rotate_calendar_token.side_effect = LookupError('Watchlist not found')
-        
-        response = self.client.post(f'/calendar/{self.test_watchlist_id}')
+        response = self.client.post(self.rotate_url)
         
         self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
     
-    @patch('src.api.routes.calendar_rest.auth_utils.get_current_user_id')
-    @patch('src.api.routes.calendar_rest.get_calendar_service')
-    def test_rotate_token_generic_error(self, mock_get_service, mock_get_user_id):
+    def test_rotate_token_generic_error(self):
         '''Test handling of generic exceptions from service.'''
-        from uuid import UUID
-        
-        mock_get_user_id.return_value = UUID(self.test_user_id)
-        
-        mock_service = Mock()
-        mock_get_service.return_value = mock_service
-        mock_service.rotate_calendar_token.side_effect = Exception('Database error')
+        self.mock_service.rotate_calendar_token.side_effect = Exception('Database error')
         
-        response = self.client.post(f'/calendar/{self.test_watchlist_id}')
+        response = self.client.post(self.rotate_url)
         
         self.assertEqual(response.status_code, HTTPStatus.INTERNAL_SERVER_ERROR)
     
@@ -303,49 +260,56 @@ class TestCalendarWatchlistRotateToken(unittest.TestCase):
         
         # Should return 404 as route won't match
         self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+        self.mock_service.rotate_calendar_token.assert_not_called()
 
 
 class TestCalendarWatchlistGetToken(unittest.TestCase):
     '''Test calendar token retrieval endpoint.'''
     
+    @classmethod
+    def setUpClass(cls):
+        '''Create the Flask app, test client, ids and service mock once for the class.'''
+        cls.app = Flask(__name__)
+        cls.app.register_blueprint(calendar_bp, url_prefix='/calendar')
+        cls.client = cls.app.test_client()
+        
+        cls.test_watchlist_id = '3fa85f64-5717-4562-b3fc-2c963f66afa6'
+        cls.test_user_id = '1234abcd-5678-1234-9012-abcdef123456'
+        cls.user_uuid = UUID(cls.test_user_id)
+        cls.token_url = f'/calendar/{cls.test_watchlist_id}'
+        cls.mock_service = create_autospec(CalendarService, instance=True)
+    
     def setUp(self):
         '''Set up test fixtures.'''
-        # Create a Flask app for testing
-        self.app = Flask(__name__)
-        self.app.register_blueprint(calendar_bp, url_prefix='/calendar')
-        self.client = self.app.test_client()
-        self.test_watchlist_id = '3fa85f64-5717-4562-b3fc-2c963f66afa6'
-        self.test_user_id = '1234abcd-5678-1234-9012-abcdef123456'
-        
         # Mock JWT verification
         self.jwt_patcher = patch('flask_jwt_extended.view_decorators.verify_jwt_in_request')
         self.mock_jwt_verify = self.jwt_patcher.start()
+        self.addCleanup(self.jwt_patcher.stop)
+        
+        # Mock the current user lookup
+        user_id_patcher = patch('src.api.routes.calendar_rest.auth_utils.get_current_user_id')
+        self.mock_get_user_id = user_id_patcher.start()
+        self.addCleanup(user_id_patcher.stop)
+        self.mock_get_user_id.return_value = self.user_uuid
+        
+        # Mock the calendar service lookup used by the route
+        get_service_patcher = patch('src.api.routes.calendar_rest.get_calendar_service')
+        self.mock_get_service = get_service_patcher.start()
+        self.addCleanup(get_service_patcher.stop)
+        self.mock_service.reset_mock(return_value=True, side_effect=True)
+        self.mock_get_service.return_value = self.mock_service
     
-    def tearDown(self):
-        self.jwt_patcher.stop()
-    
-    @patch('src.api.routes.calendar_rest.auth_utils.get_current_user_id')
-    @patch('src.api.routes.calendar_rest.get_calendar_service')
-    def test_get_token_success(self, mock_get_service, mock_get_user_id):
+    def test_get_token_success(self):
         '''Test successful token retrieval.'''
-        from uuid import UUID
-        
-        mock_user_id = UUID(self.test_user_id)
-        mock_get_user_id.return_value = mock_user_id
-        
-        mock_service = Mock()
-        mock_get_service.return_value = mock_service
-        
         existing_token = 'existing_token_abc123'
-        mock_service.get_calendar_token.return_value = existing_token
+        self.mock_service.get_calendar_token.return_value = existing_token
         
-        with self.app.test_request_context():
-            response = self.client.get(f'/calendar/{self.test_watchlist_id}')
+        response = self.client.get(self.token_url)
         
         # Verify service was called correctly
-        mock_service.get_calendar_token.assert_called_once()
-        call_kwargs = mock_service.get_calendar_token.call_args.kwargs
-        self.assertEqual(call_kwargs['user_id'], mock_user_id)
+        self.mock_service.get_calendar_token.assert_called_once()
+        call_kwargs = self.mock_service.get_calendar_token.call_args.kwargs
+        self.assertEqual(call_kwargs['user_id'], self.user_uuid)
         self.assertEqual(str(call_kwargs['watchlist_id']), self.test_watchlist_id)
         
         # Verify response
@@ -357,72 +321,38 @@ class TestCalendarWatchlistGetToken(unittest.TestCase):
         self.assertIn(existing_token, data['calendar_url'])
         self.assertIn('.ics', data['calendar_url'])
     
-    @patch('src.api.routes.calendar_rest.auth_utils.get_current_user_id')
-    @patch('src.api.routes.calendar_rest.get_calendar_service')
-    def test_get_token_constructs_url(self, mock_get_service, mock_get_user_id):
+    def test_get_token_constructs_url(self):
         '''Test that full calendar URL is constructed correctly.'''
-        from uuid import UUID
-        
-        mock_get_user_id.return_value = UUID(self.test_user_id)
-        
-        mock_service = Mock()
-        mock_get_service.return_value = mock_service
-        
         token = 'my_calendar_token'
-        mock_service.get_calendar_token.return_value = token
+        self.mock_service.get_calendar_token.return_value = token
         
-        with self.app.test_request_context():
-            response = self.client.get(f'/calendar/{self.test_watchlist_id}')
+        response = self.client.get(self.token_url)
         
         data = response.get_json()
         self.assertIn('/api/cal/', data['calendar_url'])
         self.assertTrue(data['calendar_url'].endswith(f'{token}.ics'))
     
-    @patch('src.api.routes.calendar_rest.auth_utils.get_current_user_id')
-    @patch('src.api.routes.calendar_rest.get_calendar_service')
-    def test_get_token_value_error(self, mock_get_service, mock_get_user_id):
+    def test_get_token_value_error(self):
         '''Test handling of ValueError from service.'''
-        from uuid import UUID
-        
-        mock_get_user_id.return_value = UUID(self.test_user_id)
-        
-        mock_service = Mock()
-        mock_get_service.return_value = mock_service
-        mock_service.get_calendar_token.side_effect = ValueError('Invalid watchlist ID')
+        self.mock_service.get_calendar_token.side_effect = ValueError('Invalid watchlist ID')
         
-        response = self.client.get(f'/calendar/{self.test_watchlist_id}')
+        response = self.client.get(self.token_url)
         
         self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
     
-    @patch('src.api.routes.calendar_rest.auth_utils.get_current_user_id')
-    @patch('src.api.routes.calendar_rest.get_calendar_service')
-    def test_get_token_lookup_error(self, mock_get_service, mock_get_user_id):
+    def test_get_token_lookup_error(self):
         '''Test handling of LookupError from service.'''
-        from uuid import UUID
+        self.mock_service.get_calendar_token.side_effect = LookupError('Watchlist not found')
         
-        mock_get_user_id.return_value = UUID(self.test_user_id)
-        
-        mock_service = Mock()
-        mock_get_service.return_value = mock_service
-        mock_service.get_calendar_token.side_effect = LookupError('Watchlist not found')
-        
-        response = self.client.get(f'/calendar/{self.test_watchlist_id}')
+        response = self.client.get(self.token_url)
         
         self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
     
-    @patch('src.api.routes.calendar_rest.auth_utils.get_current_user_id')
-    @patch('src.api.routes.calendar_rest.get_calendar_service')
-    def test_get_token_generic_error(self, mock_get_service, mock_get_user_id):
+    def test_get_token_generic_error(self):
         '''Test handling of generic exceptions from service.'''
-        from uuid import UUID
-        
-        mock_get_user_id.return_value = UUID(self.test_user_id)
-        
-        mock_service = Mock()
-        mock_get_service.return_value = mock_service
-        mock_service.get_calendar_token.side_effect = Exception('Database error')
+        self.mock_service.get_calendar_token.side_effect = Exception('Database error')
         
-        response = self.client.get(f'/calendar/{self.test_watchlist_id}')
+        response = self.client.get(self.token_url)
         
         self.assertEqual(response.status_code, HTTPStatus.INTERNAL_SERVER_ERROR)
     
@@ -432,24 +362,15 @@ class TestCalendarWatchlistGetToken(unittest.TestCase):
         
         # Should return 404 as route won't match
         self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+        self.mock_service.get_calendar_token.assert_not_called()
     
-    @patch('src.api.routes.calendar_rest.auth_utils.get_current_user_id')
-    @patch('src.api.routes.calendar_rest.get_calendar_service')
-    def test_get_token_returns_same_token_on_multiple_calls(self, mock_get_service, mock_get_user_id):
+    def test_get_token_returns_same_token_on_multiple_calls(self):
         '''Test that GET returns the same token on multiple calls (idempotent).'''
-        from uuid import UUID
-        
-        mock_get_user_id.return_value = UUID(self.test_user_id)
-        
-        mock_service = Mock()
-        mock_get_service.return_value = mock_service
-        
         token = 'stable_token_xyz'
-        mock_service.get_calendar_token.return_value = token
+        self.mock_service.get_calendar_token.return_value = token
         
-        with self.app.test_request_context():
-            response1 = self.client.get(f'/calendar/{self.test_watchlist_id}')
-            response2 = self.client.get(f'/calendar/{self.test_watchlist_id}')
+        response1 = self.client.get(self.token_url)
+        response2 = self.client.get(self.token_url)
         
         data1 = response1.get_json()
         data2 = response2.get_json()
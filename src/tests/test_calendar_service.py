@@ -4,21 +4,119 @@ Unit tests for CalendarService.
 '''
 
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 from datetime import datetime, timedelta, timezone
-from uuid import uuid4
+from types import MappingProxyType
+from uuid import UUID
 
 from src.app.services.calendar_service import CalendarService
+from src.database.adapter_factory import DatabaseAdapterFactory
 from src.models.stock_event_model import EventType
 
 
+# Fixed watchlist id; the tests only compare it with what they handed the mock database
+_WATCHLIST_ID = UUID('00000000-0000-0000-0000-000000000001')
+
+# Reminder offset configured on the test watchlists
+_ONE_DAY = timedelta(days=1)
+
+# Watchlist columns of the calendar query for the watchlist shapes under test
+_DEFAULT_WATCHLIST_ROW = MappingProxyType({
+    'watchlist_name': 'Tech Stocks',
+    'reminder_before': _ONE_DAY,
+})
+_NO_NAME_WATCHLIST_ROW = MappingProxyType({
+    'watchlist_name': None,
+    'reminder_before': _ONE_DAY,
+})
+_NO_REMINDER_WATCHLIST_ROW = MappingProxyType({
+    'watchlist_name': 'Growth Stocks',
+    'reminder_before': None,
+})
+
+# Read-only event rows shared by the calendar tests; built once at import time
+_AAPL_EARNINGS_ROW = MappingProxyType({
+    'ticker': 'AAPL',
+    'name': 'Apple Inc.',
+    'stock_last_updated': datetime(2025, 1, 1, tzinfo=timezone.utc),
+    'type': 'EARNINGS_ANNOUNCEMENT',
+    'event_date': datetime(2025, 2, 1, tzinfo=timezone.utc),
+    'event_last_updated': datetime(2025, 1, 15, tzinfo=timezone.utc),
+    'source': 'AlphaVantage',
+})
+_MSFT_DIVIDEND_ROW = MappingProxyType({
+    'ticker': 'MSFT',
+    'name': 'Microsoft Corporation',
+    'stock_last_updated': datetime(2025, 1, 2, tzinfo=timezone.utc),
+    'type': 'DIVIDEND_PAYMENT',
+    'event_date': datetime(2025, 3, 1, tzinfo=timezone.utc),
+    'event_last_updated': datetime(2025, 2, 1, tzinfo=timezone.utc),
+    'source': 'Finnhub',
+})
+_TSLA_SPLIT_ROW = MappingProxyType({
+    'ticker': 'TSLA',
+    'name': 'Tesla Inc.',
+    'stock_last_updated': datetime(2025, 1, 1, tzinfo=timezone.utc),
+    'type': 'STOCK_SPLIT',
+    'event_date': datetime(2025, 4, 1, tzinfo=timezone.utc),
+    'event_last_updated': datetime(2025, 3, 1, tzinfo=timezone.utc),
+    'source': 'AlphaVantage',
+})
+_GOOGL_DIVIDEND_EX_ROW = MappingProxyType({
+    'ticker': 'GOOGL',
+    'name': 'Alphabet Inc.',
+    'stock_last_updated': datetime(2025, 4, 1, tzinfo=timezone.utc),
+    'type': 'DIVIDEND_EX',
+    'event_date': datetime(2025, 5, 1, tzinfo=timezone.utc),
+    'event_last_updated': datetime(2025, 4, 1, tzinfo=timezone.utc),
+    'source': 'Finnhub',
+})
+
+# Event columns of the single row returned for a watchlist without matching events
+_NO_EVENT_COLUMNS = MappingProxyType(dict.fromkeys(_AAPL_EARNINGS_ROW))
+
+# A followed stock without matching events: stock columns set, event columns NULL
+_NVDA_WITHOUT_EVENTS_ROW = MappingProxyType({
+    **_NO_EVENT_COLUMNS,
+    'ticker': 'NVDA',
+    'name': 'NVIDIA Corporation',
+    'stock_last_updated': datetime(2025, 1, 3, tzinfo=timezone.utc),
+})
+
+
+def _calendar_rows(watchlist, events):
+    '''Shape rows like the joined calendar query: the watchlist columns repeated per event.'''
+    return tuple(MappingProxyType({**watchlist, **event}) for event in events or (_NO_EVENT_COLUMNS,))
+
+
+# Complete calendar query results, built once at import time and looked up by name in the tests
+_CALENDAR_RESULTS = MappingProxyType({
+    'aapl': _calendar_rows(_DEFAULT_WATCHLIST_ROW, (_AAPL_EARNINGS_ROW,)),
+    'aapl_msft': _calendar_rows(_DEFAULT_WATCHLIST_ROW, (_AAPL_EARNINGS_ROW, _MSFT_DIVIDEND_ROW)),
+    'googl': _calendar_rows(_DEFAULT_WATCHLIST_ROW, (_GOOGL_DIVIDEND_EX_ROW,)),
+    # PostgreSQL sorts the NULL event_date of the eventless stock last
+    'aapl_msft_nvda_without_events': _calendar_rows(
+        _DEFAULT_WATCHLIST_ROW, (_AAPL_EARNINGS_ROW, _MSFT_DIVIDEND_ROW, _NVDA_WITHOUT_EVENTS_ROW)
+    ),
+    'no_events': _calendar_rows(_DEFAULT_WATCHLIST_ROW, ()),
+    'no_name_no_events': _calendar_rows(_NO_NAME_WATCHLIST_ROW, ()),
+    'no_reminder_tsla': _calendar_rows(_NO_REMINDER_WATCHLIST_ROW, (_TSLA_SPLIT_ROW,)),
+})
+
+
+def _assert_query_contains(test, query, needles):
+    '''Assert that every needle appears in the SQL query, reporting all missing ones at once.'''
+    missing = [needle for needle in needles if needle not in query]
+    test.assertFalse(missing, f'Query is missing {missing}')
+
+
 class TestCalendarServiceInitialization(unittest.TestCase):
     '''Test CalendarService initialization.'''
     
-    @patch('src.app.services.calendar_service.DatabaseAdapterFactory.get_instance')
+    @patch.object(DatabaseAdapterFactory, 'get_instance')
     def test_init(self, mock_db_factory):
         '''Test service initializes with database adapter.'''
-        mock_db = Mock()
+        mock_db = Mock(spec_set=['execute_query'])
         mock_db_factory.return_value = mock_db
         
         service = CalendarService()
@@ -30,133 +128,78 @@ class TestCalendarServiceInitialization(unittest.TestCase):
 class TestGetCalendar(unittest.TestCase):
     '''Test calendar retrieval and generation.'''
     
+    @classmethod
+    def setUpClass(cls):
+        '''Build one service around a shared mock database for the class.'''
+        cls.mock_db = Mock(spec_set=['execute_query'])
+        
+        with patch.object(DatabaseAdapterFactory, 'get_instance', return_value=cls.mock_db):
+            cls.service = CalendarService()
+        
+        # Patched for the whole class; setUp resets it between tests
+        cls.mock_build_ics = cls.enterClassContext(patch('src.app.utils.calendar_utils.build_ics'))
+        
+        cls.calendar_token = 'test_token_12345'
+    
     def setUp(self):
-        '''Set up test fixtures.'''
-        self.mock_db = Mock()
-        
-        with patch('src.app.services.calendar_service.DatabaseAdapterFactory.get_instance', return_value=self.mock_db):
-            self.service = CalendarService()
-        
-        self.calendar_token = 'test_token_12345'
-        self.watchlist_id = uuid4()
-        self.default_watchlist = {
-            'id': self.watchlist_id,
-            'name': 'Tech Stocks',
-            'reminder_before': timedelta(days=1),
-        }
+        '''Reset the shared mocks between tests.'''
+        self.mock_db.reset_mock(return_value=True, side_effect=True)
+        self.mock_build_ics.reset_mock()
+        self.mock_build_ics.return_value = 'calendar_content'
     
-    def _set_db_results(self, *, watchlist=None, events=None):
-        watchlist_rows = [watchlist or self.default_watchlist]
-        event_rows = events if events is not None else []
-        self.mock_db.execute_query.side_effect = [watchlist_rows, event_rows]
+    def _set_db_results(self, name):
+        '''Make the mock database return the prebuilt calendar query result with the given name.'''
+        self.mock_db.execute_query.return_value = _CALENDAR_RESULTS[name]
     
-    @patch('src.app.utils.calendar_utils.build_ics')
-    def test_get_calendar_success(self, mock_build_ics):
+    def test_get_calendar_success(self):
         '''Test successful calendar generation.'''
-        events = [
-            {
-                'ticker': 'AAPL',
-                'name': 'Apple Inc.',
-                'stock_last_updated': datetime(2025, 1, 1, tzinfo=timezone.utc),
-                'type': 'EARNINGS_ANNOUNCEMENT',
-                'event_date': datetime(2025, 2, 1, tzinfo=timezone.utc),
-                'event_last_updated': datetime(2025, 1, 15, tzinfo=timezone.utc),
-                'source': 'AlphaVantage',
-            }
-        ]
-        self._set_db_results(events=events)
-        mock_build_ics.return_value = 'BEGIN:VCALENDAR\r\n...\r\nEND:VCALENDAR\r\n'
+        self._set_db_results('aapl')
+        self.mock_build_ics.return_value = 'BEGIN:VCALENDAR\r\n...\r\nEND:VCALENDAR\r\n'
         
         result = self.service.get_calendar(token=self.calendar_token)
         
-        self.assertEqual(self.mock_db.execute_query.call_count, 2)
-        metadata_call, events_call = self.mock_db.execute_query.call_args_list
-        self.assertEqual(metadata_call.kwargs['params']['token'], self.calendar_token)
-        self.assertEqual(events_call.kwargs['params']['watchlist_id'], self.watchlist_id)
+        self.mock_db.execute_query.assert_called_once_with(query=ANY, params={'token': self.calendar_token})
         
-        mock_build_ics.assert_called_once()
-        call_args = mock_build_ics.call_args
+        self.mock_build_ics.assert_called_once()
+        call_args = self.mock_build_ics.call_args
         self.assertEqual(len(call_args.kwargs['stock_events']), 1)
         self.assertEqual(call_args.kwargs['watchlist_name'], 'Tech Stocks')
-        self.assertEqual(call_args.kwargs['reminder_before'], timedelta(days=1))
-        self.assertIn('BEGIN:VCALENDAR', result)
+        self.assertEqual(call_args.kwargs['reminder_before'], _ONE_DAY)
+        self.assertIs(result, self.mock_build_ics.return_value)
     
-    @patch('src.app.utils.calendar_utils.build_ics')
-    def test_get_calendar_multiple_events(self, mock_build_ics):
-        '''Test calendar generation with multiple events.'''
-        events = [
-            {
-                'ticker': 'AAPL',
-                'name': 'Apple Inc.',
-                'stock_last_updated': datetime(2025, 1, 1, tzinfo=timezone.utc),
-                'type': 'EARNINGS_ANNOUNCEMENT',
-                'event_date': datetime(2025, 2, 1, tzinfo=timezone.utc),
-                'event_last_updated': datetime(2025, 1, 15, tzinfo=timezone.utc),
-                'source': 'AlphaVantage',
-            },
-            {
-                'ticker': 'MSFT',
-                'name': 'Microsoft Corporation',
-                'stock_last_updated': datetime(2025, 1, 2, tzinfo=timezone.utc),
-                'type': 'DIVIDEND_PAYMENT',
-                'event_date': datetime(2025, 3, 1, tzinfo=timezone.utc),
-                'event_last_updated': datetime(2025, 2, 1, tzinfo=timezone.utc),
-                'source': 'Finnhub',
-            }
-        ]
-        self._set_db_results(events=events)
-        mock_build_ics.return_value = 'calendar_content'
-        
-        self.service.get_calendar(token=self.calendar_token)
-        
-        stock_events = mock_build_ics.call_args.kwargs['stock_events']
-        self.assertEqual(len(stock_events), 2)
-    
-    @patch('src.app.utils.calendar_utils.build_ics')
-    def test_get_calendar_empty_results(self, mock_build_ics):
-        '''Test calendar generation with no events still returns metadata name.'''
-        no_name_watchlist = {
-            'id': self.watchlist_id,
-            'name': None,
-            'reminder_before': timedelta(days=1),
-        }
-        self._set_db_results(watchlist=no_name_watchlist, events=[])
-        mock_build_ics.return_value = 'BEGIN:VCALENDAR\r\nEND:VCALENDAR\r\n'
-        
-        self.service.get_calendar(token=self.calendar_token)
-        
-        call_args = mock_build_ics.call_args
-        self.assertEqual(len(call_args.kwargs['stock_events']), 0)
-        self.assertEqual(call_args.kwargs['watchlist_name'], 'Stock Events')
+    def test_get_calendar_build_ics_arguments(self):
+        '''Test the events, name and reminder passed to build_ics for each watchlist shape.'''
+        # (calendar result name, expected event count, expected name, expected reminder)
+        cases = (
+            ('aapl_msft', 2, 'Tech Stocks', _ONE_DAY),
+            ('no_name_no_events', 0, 'Stock Events', _ONE_DAY),
+            ('no_reminder_tsla', 1, 'Growth Stocks', None),
+        )
+        for name, expected_count, expected_name, expected_reminder in cases:
+            with self.subTest(name):
+                self._set_db_results(name)
+                
+                self.service.get_calendar(token=self.calendar_token)
+                
+                kwargs = self.mock_build_ics.call_args.kwargs
+                self.assertEqual(len(kwargs['stock_events']), expected_count)
+                self.assertEqual(kwargs['watchlist_name'], expected_name)
+                self.assertEqual(kwargs['reminder_before'], expected_reminder)
     
-    @patch('src.app.utils.calendar_utils.build_ics')
-    def test_get_calendar_no_reminder(self, mock_build_ics):
-        '''Test calendar generation without reminder.'''
-        no_reminder_watchlist = {
-            'id': self.watchlist_id,
-            'name': 'Growth Stocks',
-            'reminder_before': None,
-        }
-        events = [
-            {
-                'ticker': 'TSLA',
-                'name': 'Tesla Inc.',
-                'stock_last_updated': datetime(2025, 1, 1, tzinfo=timezone.utc),
-                'type': 'STOCK_SPLIT',
-                'event_date': datetime(2025, 4, 1, tzinfo=timezone.utc),
-                'event_last_updated': datetime(2025, 3, 1, tzinfo=timezone.utc),
-                'source': 'AlphaVantage',
-            }
-        ]
-        self._set_db_results(watchlist=no_reminder_watchlist, events=events)
-        mock_build_ics.return_value = 'calendar_content'
+    def test_get_calendar_skips_stocks_without_events(self):
+        '''Test that NULL-event rows of followed stocks are dropped next to real events.'''
+        self._set_db_results('aapl_msft_nvda_without_events')
         
         self.service.get_calendar(token=self.calendar_token)
         
-        self.assertIsNone(mock_build_ics.call_args.kwargs['reminder_before'])
+        stock_events = self.mock_build_ics.call_args.kwargs['stock_events']
+        self.assertEqual(
+            [(event.stock.symbol, event.type) for event in stock_events],
+            [('AAPL', EventType.EARNINGS_ANNOUNCEMENT), ('MSFT', EventType.DIVIDEND_PAYMENT)],
+        )
     
     def test_get_calendar_db_error(self):
-        '''Test calendar generation handles database errors from metadata query.'''
+        '''Test calendar generation handles database errors from the calendar query.'''
         self.mock_db.execute_query.side_effect = Exception('Database connection failed')
         
         with self.assertRaises(Exception) as context:
@@ -164,56 +207,32 @@ class TestGetCalendar(unittest.TestCase):
         
         self.assertIn('Database connection failed', str(context.exception))
     
-    @patch('src.app.utils.calendar_utils.build_ics')
-    def test_get_calendar_filters_event_types(self, mock_build_ics):
-        '''Test that SQL query filters by watchlist settings.'''
-        self._set_db_results(events=[])
-        mock_build_ics.return_value = 'calendar_content'
-        
-        self.service.get_calendar(token=self.calendar_token)
-        
-        query = self.mock_db.execute_query.call_args_list[1].kwargs['query']
-        self.assertIn('include_earnings_announcement', query)
-        self.assertIn('include_dividend_ex', query)
-        self.assertIn('include_dividend_payment', query)
-        self.assertIn('include_stock_split', query)
-    
-    @patch('src.app.utils.calendar_utils.build_ics')
-    def test_get_calendar_uses_parameterized_query(self, mock_build_ics):
-        '''Test that queries use parameter binding for security.'''
-        self._set_db_results(events=[])
-        mock_build_ics.return_value = 'calendar_content'
+    def test_get_calendar_query_shape(self):
+        '''Test that the SQL query filters by watchlist settings and binds the token as a parameter.'''
+        self._set_db_results('no_events')
         
         token = 'secure_token_abc123'
         self.service.get_calendar(token=token)
         
-        metadata_call, events_call = self.mock_db.execute_query.call_args_list
-        self.assertIn(':token', metadata_call.kwargs['query'])
-        self.assertEqual(metadata_call.kwargs['params']['token'], token)
-        self.assertIn(':watchlist_id', events_call.kwargs['query'])
-        self.assertEqual(events_call.kwargs['params']['watchlist_id'], self.watchlist_id)
-        self.assertNotIn('LIKE', events_call.kwargs['query'])
+        call_kwargs = self.mock_db.execute_query.call_args.kwargs
+        query = call_kwargs['query']
+        _assert_query_contains(self, query, (
+            'include_earnings_announcement',
+            'include_dividend_ex',
+            'include_dividend_payment',
+            'include_stock_split',
+            ':token',
+        ))
+        self.assertNotIn('LIKE', query)
+        self.assertEqual(call_kwargs['params'], {'token': token})
     
-    @patch('src.app.utils.calendar_utils.build_ics')
-    def test_get_calendar_converts_stock_event_types(self, mock_build_ics):
+    def test_get_calendar_converts_stock_event_types(self):
         '''Test that event types are properly converted from strings.'''
-        events = [
-            {
-                'ticker': 'GOOGL',
-                'name': 'Alphabet Inc.',
-                'stock_last_updated': datetime.now(timezone.utc),
-                'type': 'DIVIDEND_EX',
-                'event_date': datetime(2025, 5, 1, tzinfo=timezone.utc),
-                'event_last_updated': datetime.now(timezone.utc),
-                'source': 'Finnhub',
-            }
-        ]
-        self._set_db_results(events=events)
-        mock_build_ics.return_value = 'calendar_content'
+        self._set_db_results('googl')
         
         self.service.get_calendar(token=self.calendar_token)
         
-        stock_events = mock_build_ics.call_args.kwargs['stock_events']
+        stock_events = self.mock_build_ics.call_args.kwargs['stock_events']
         self.assertEqual(stock_events[0].type, EventType.DIVIDEND_EX)
     
     def test_get_calendar_missing_watchlist(self):
@@ -232,15 +251,20 @@ class TestGetCalendar(unittest.TestCase):
 class TestRotateCalendarToken(unittest.TestCase):
     '''Test calendar token rotation.'''
     
-    def setUp(self):
-        '''Set up test fixtures.'''
-        self.mock_db = Mock()
+    @classmethod
+    def setUpClass(cls):
+        '''Build one service around a shared mock database for the class.'''
+        cls.mock_db = Mock(spec_set=['execute_query'])
         
-        with patch('src.app.services.calendar_service.DatabaseAdapterFactory.get_instance', return_value=self.mock_db):
-            self.service = CalendarService()
+        with patch.object(DatabaseAdapterFactory, 'get_instance', return_value=cls.mock_db):
+            cls.service = CalendarService()
         
-        self.user_id = 1
-        self.watchlist_id = uuid4()
+        cls.user_id = 1
+        cls.watchlist_id = _WATCHLIST_ID
+    
+    def setUp(self):
+        '''Reset the shared mock database between tests.'''
+        self.mock_db.reset_mock(return_value=True, side_effect=True)
     
     @patch('src.app.utils.calendar_utils.generate_calendar_token')
     def test_rotate_token_success(self, mock_generate_token):
@@ -293,25 +317,19 @@ class TestRotateCalendarToken(unittest.TestCase):
                 watchlist_id=self.watchlist_id
             )
     
-    def test_rotate_token_invalid_user_id(self):
-        '''Test ValueError raised for invalid user_id type.'''
-        with self.assertRaises(ValueError) as context:
-            self.service.rotate_calendar_token(
-                user_id='not-an-int', # pyright: ignore[reportArgumentType]
-                watchlist_id=self.watchlist_id
-            )
-        
-        self.assertIn('user_id must be an integer', str(context.exception))
-    
-    def test_rotate_token_invalid_watchlist_id(self):
-        '''Test ValueError raised for invalid watchlist_id type.'''
-        with self.assertRaises(ValueError) as context:
-            self.service.rotate_calendar_token(
-                user_id=self.user_id,
-                watchlist_id='not-a-uuid' # pyright: ignore[reportArgumentType]
-            )
-        
-        self.assertIn('watchlist_id must be a UUID', str(context.exception))
+    def test_rotate_token_invalid_input(self):
+        '''Test ValueError raised for invalid user_id and watchlist_id types.'''
+        cases = (
+            ('invalid_user_id', 'not-an-int', self.watchlist_id, 'user_id must be an integer'),
+            ('invalid_watchlist_id', self.user_id, 'not-a-uuid', 'watchlist_id must be a UUID'),
+        )
+        for case_id, user_id, watchlist_id, message in cases:
+            with self.subTest(case_id):
+                with self.assertRaisesRegex(ValueError, message):
+                    self.service.rotate_calendar_token(
+                        user_id=user_id, # pyright: ignore[reportArgumentType]
+                        watchlist_id=watchlist_id # pyright: ignore[reportArgumentType]
+                    )
     
     @patch('src.app.utils.calendar_utils.generate_calendar_token')
     def test_rotate_token_uses_parameterized_query(self, mock_generate_token):
@@ -325,9 +343,7 @@ class TestRotateCalendarToken(unittest.TestCase):
         )
         
         call_kwargs = self.mock_db.execute_query.call_args.kwargs
-        self.assertIn(':new_token', call_kwargs['query'])
-        self.assertIn(':watchlist_id', call_kwargs['query'])
-        self.assertIn(':user_id', call_kwargs['query'])
+        _assert_query_contains(self, call_kwargs['query'], (':new_token', ':watchlist_id', ':user_id'))
     
     @patch('src.app.utils.calendar_utils.generate_calendar_token')
     def test_rotate_token_db_error(self, mock_generate_token):
@@ -347,16 +363,21 @@ class TestRotateCalendarToken(unittest.TestCase):
 class TestGetCalendarToken(unittest.TestCase):
     '''Test calendar token retrieval.'''
     
-    def setUp(self):
-        '''Set up test fixtures.'''
-        self.mock_db = Mock()
+    @classmethod
+    def setUpClass(cls):
+        '''Build one service around a shared mock database for the class.'''
+        cls.mock_db = Mock(spec_set=['execute_query'])
         
-        with patch('src.app.services.calendar_service.DatabaseAdapterFactory.get_instance', return_value=self.mock_db):
-            self.service = CalendarService()
+        with patch.object(DatabaseAdapterFactory, 'get_instance', return_value=cls.mock_db):
+            cls.service = CalendarService()
         
-        self.user_id = 1
-        self.watchlist_id = uuid4()
-        self.test_token = 'existing_token_abc123'
+        cls.user_id = 1
+        cls.watchlist_id = _WATCHLIST_ID
+        cls.test_token = 'existing_token_abc123'
+    
+    def setUp(self):
+        '''Reset the shared mock database between tests.'''
+        self.mock_db.reset_mock(return_value=True, side_effect=True)
     
     def test_get_token_success(self):
         '''Test successful token retrieval.'''
@@ -399,25 +420,19 @@ class TestGetCalendarToken(unittest.TestCase):
                 watchlist_id=self.watchlist_id
             )
     
-    def test_get_token_invalid_user_id(self):
-        '''Test ValueError raised for invalid user_id type.'''
-        with self.assertRaises(ValueError) as context:
-            self.service.get_calendar_token(
-                user_id='not-an-int', # pyright: ignore[reportArgumentType]
-                watchlist_id=self.watchlist_id
-            )
-        
-        self.assertIn('user_id must be an integer', str(context.exception))
-    
-    def test_get_token_invalid_watchlist_id(self):
-        '''Test ValueError raised for invalid watchlist_id type.'''
-        with self.assertRaises(ValueError) as context:
-            self.service.get_calendar_token(
-                user_id=self.user_id,
-                watchlist_id='not-a-uuid' # pyright: ignore[reportArgumentType]
-            )
-        
-        self.assertIn('watchlist_id must be a UUID', str(context.exception))
+    def test_get_token_invalid_input(self):
+        '''Test ValueError raised for invalid user_id and watchlist_id types.'''
+        cases = (
+            ('invalid_user_id', 'not-an-int', self.watchlist_id, 'user_id must be an integer'),
+            ('invalid_watchlist_id', self.user_id, 'not-a-uuid', 'watchlist_id must be a UUID'),
+        )
+        for case_id, user_id, watchlist_id, message in cases:
+            with self.subTest(case_id):
+                with self.assertRaisesRegex(ValueError, message):
+                    self.service.get_calendar_token(
+                        user_id=user_id, # pyright: ignore[reportArgumentType]
+                        watchlist_id=watchlist_id # pyright: ignore[reportArgumentType]
+                    )
     
     def test_get_token_uses_parameterized_query(self):
         '''Test that query uses parameterized query for security.'''
@@ -429,8 +444,7 @@ class TestGetCalendarToken(unittest.TestCase):
         )
         
         call_kwargs = self.mock_db.execute_query.call_args.kwargs
-        self.assertIn(':watchlist_id', call_kwargs['query'])
-        self.assertIn(':user_id', call_kwargs['query'])
+        _assert_query_contains(self, call_kwargs['query'], (':watchlist_id', ':user_id'))
     
     def test_get_token_db_error(self):
         '''Test handling of database errors.'''